@@ -20,6 +20,7 @@ from pathlib import Path
 
 from libs.graph import build_full_graph, build_thin_graph, build_streaming_test_graph, build_hitl_graph, build_hitl_enhanced_graph
 from libs.job_service import JobService, create_decision_set_for_thread
+from libs.llm_agent_base import prewarm_agent_validators
 from libs.database import create_database_engine, create_session_maker
 from libs.models import JobStatus, Job, DecisionSet
 from langgraph.types import Command
@@ -1405,6 +1406,9 @@ async def startup_event():
 
     logger.info("Starting integrated API + Worker server")
 
+    # Compile deferred agent model validators before the first request
+    prewarm_agent_validators()
+
     # Initialize and start the integrated worker
     _worker_service = IntegratedWorkerService()
     await _worker_service.start_background_worker()
@@ -7,7 +7,8 @@ Implements intelligent questioning strategies to maximize information gain.
 
 from __future__ import annotations
 
-from typing import Type, Dict, Any
+from bisect import bisect_right
+from typing import Type, Dict, Any, Optional
 import logging
 
 from .llm_agent_base import BaseLLMAgent, MLOpsExecutionContext
@@ -17,6 +18,14 @@ from .mock_agents import create_mock_adaptive_questions_agent
 
 logger = logging.getLogger(__name__)
 
+# Coverage score thresholds and the questioning strategy for each band
+_STRATEGY_THRESHOLDS = (0.5, 0.75)
+_STRATEGY_MSGS = (
+    "Focus on fundamental requirements (budget, workload, scale)",
+    "Address remaining critical gaps and key ambiguities",
+    "Focus on high-value optional details for optimization",
+)
+
 
 class AdaptiveQuestionsAgent(BaseLLMAgent):
     """
@@ -226,14 +235,7 @@ Focus on practical completeness that enables confident architecture recommendati
             ]
         )
 
-        if score < 0.5:
-            prompt_parts.append(
-                "Focus on fundamental requirements (budget, workload, scale)"
-            )
-        elif score < 0.75:
-            prompt_parts.append("Address remaining critical gaps and key ambiguities")
-        else:
-            prompt_parts.append("Focus on high-value optional details for optimization")
+        prompt_parts.append(_STRATEGY_MSGS[bisect_right(_STRATEGY_THRESHOLDS, score)])
 
         prompt_parts.extend(
             [
@@ -331,34 +333,48 @@ Focus on practical completeness that enables confident architecture recommendati
         Returns:
             True if questioning should continue, False otherwise
         """
-        questioning_history = state.get("questioning_history", [])
         # Try to get coverage from analysis first, then fall back to direct coverage_score
-        current_coverage = state.get("coverage_analysis", {}).get(
-            "score", state.get("coverage_score", 0.0)
+        coverage_analysis = state.get("coverage_analysis", {})
+        reason = termination_reason(
+            rounds=len(state.get("questioning_history", [])),
+            coverage=coverage_analysis.get("score", state.get("coverage_score", 0.0)),
+            critical_gap_count=len(coverage_analysis.get("critical_gaps", [])),
+            complete=state.get("questioning_complete", False),
+            max_rounds=max_rounds,
+            target_coverage=target_coverage,
         )
-        questioning_complete = state.get("questioning_complete", False)
-
-        # Check termination conditions
-        if questioning_complete:
-            return False
+        if reason:
+            logger.info(reason)
+        return reason is None
 
-        if len(questioning_history) >= max_rounds:
-            logger.info(f"Max questioning rounds ({max_rounds}) reached")
-            return False
 
-        if current_coverage >= target_coverage:
-            logger.info(f"Target coverage ({target_coverage:.1%}) achieved")
-            return False
+# Minimum coverage at which questioning may stop once no critical gaps remain
+_MIN_COVERAGE_WITHOUT_GAPS = 0.7
 
-        # Check for critical gaps
-        coverage_analysis = state.get("coverage_analysis", {})
-        critical_gaps = coverage_analysis.get("critical_gaps", [])
 
-        if len(critical_gaps) == 0 and current_coverage >= 0.7:
-            logger.info("No critical gaps remaining and minimum coverage achieved")
-            return False
+def termination_reason(
+    rounds: int,
+    coverage: float,
+    critical_gap_count: int,
+    complete: bool = False,
+    max_rounds: int = 3,
+    target_coverage: float = 0.75,
+) -> Optional[str]:
+    """
+    Evaluate the questioning termination rules on plain values.
 
-        return True
+    Returns:
+        A human-readable reason when questioning should stop, else None
+    """
+    if complete:
+        return "Questioning marked complete"
+    if rounds >= max_rounds:
+        return f"Max questioning rounds ({max_rounds}) reached"
+    if coverage >= target_coverage:
+        return f"Target coverage ({target_coverage:.1%}) achieved"
+    if critical_gap_count == 0 and coverage >= _MIN_COVERAGE_WITHOUT_GAPS:
+        return "No critical gaps remaining and minimum coverage achieved"
+    return None
 
 
 def create_adaptive_questions_agent() -> AdaptiveQuestionsAgent:
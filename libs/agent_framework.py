@@ -8,13 +8,14 @@ for transparent decision making.
 
 from __future__ import annotations
 
+import time
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 class AgentType(Enum):
@@ -109,7 +110,8 @@ class MLOpsWorkflowState(TypedDict, total=False):
 
     # Execution metadata
     run_meta: Optional[Dict[str, Any]]
-    last_updated: Optional[str]
+    last_updated: Optional[str]  # Legacy ISO string; agents set last_updated_ns
+    last_updated_ns: Optional[int]
     execution_order: Optional[List[str]]
 
     # LLM-specific fields for enhanced agent capabilities
@@ -142,12 +144,29 @@ class MLOpsWorkflowState(TypedDict, total=False):
 # MLOpsProjectState removed - all code now uses MLOpsWorkflowState directly
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert a ``time.time_ns()`` value to an aware UTC datetime."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc)
+
+
 # Pydantic Models for Reason Cards and Transparency
 
 
+# Reason card models are built once per agent execution and dumped into the
+# workflow state, so schema construction is deferred until first use.
+_REASON_CARD_CONFIG = ConfigDict(
+    defer_build=True, extra="forbid", ser_json_inf_nan="null"
+)
+
+
 class CandidateOption(BaseModel):
     """A candidate option considered by an agent."""
 
+    model_config = _REASON_CARD_CONFIG
+
     id: str
     summary: str
     tradeoffs: List[str]
@@ -174,6 +193,8 @@ class PolicyResult(BaseModel):
 class ImpactAssessment(BaseModel):
     """Assessment of decision impacts."""
 
+    model_config = _REASON_CARD_CONFIG
+
     monthly_usd: Optional[float] = None
     p95_latency_ms: Optional[int] = None
     availability_impact: Optional[str] = None
@@ -187,11 +208,13 @@ class ReasonCard(BaseModel):
     This is what gets streamed to users for full transparency.
     """
 
+    model_config = ConfigDict(**_REASON_CARD_CONFIG, use_enum_values=True)
+
     decision_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     agent: AgentType
     node_name: str
     trigger: TriggerType
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: int = Field(default_factory=time.time_ns)  # ns since epoch
 
     # Input context
     inputs: Dict[str, Any] = Field(default_factory=dict)
@@ -217,8 +240,23 @@ class ReasonCard(BaseModel):
     # Agent-specific outputs
     outputs: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        use_enum_values = True
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def _coerce_timestamp(cls, v):
+        """Accept datetimes and ISO strings alongside raw nanoseconds."""
+        if isinstance(v, str):
+            v = datetime.fromisoformat(v.replace("Z", "+00:00"))
+        if isinstance(v, datetime):
+            # Naive values are UTC, as the previous datetime field stored them
+            if v.tzinfo is None:
+                v = v.replace(tzinfo=timezone.utc)
+            return (v - _EPOCH) // timedelta(microseconds=1) * 1000
+        return v
+
+    @field_serializer("timestamp")
+    def _serialize_timestamp(self, ns: int) -> datetime:
+        """Format the timestamp lazily, only when the card is dumped."""
+        return _ns_to_datetime(ns)
 
 
 class AgentOutput(BaseModel):
@@ -323,9 +361,11 @@ class BaseMLOpsAgent(ABC):
         if "execution_order" not in state:
             state["execution_order"] = []
 
+        # Same full dump as the graph nodes use, so reason card
+        # de-duplication sees one shape per card
         state["reason_cards"].append(reason_card.model_dump())
         state["execution_order"].append(self.agent_type.value)
-        state["last_updated"] = datetime.now(timezone.utc).isoformat()
+        state["last_updated_ns"] = time.time_ns()
 
 
 @dataclass
@@ -342,24 +382,30 @@ class AgentRegistry:
     """Registry for managing available MLOps agents."""
 
     def __init__(self):
+        # Dict insertion order doubles as the execution order
         self._agents: Dict[AgentType, BaseMLOpsAgent] = {}
-        self._execution_order: List[AgentType] = []
 
     def register_agent(self, agent: BaseMLOpsAgent, position: Optional[int] = None):
         """Register an agent in the system."""
-        self._agents[agent.agent_type] = agent
-        if position is not None:
-            self._execution_order.insert(position, agent.agent_type)
-        else:
-            self._execution_order.append(agent.agent_type)
+        if position is None:
+            self._agents[agent.agent_type] = agent
+            return
+
+        others = [
+            (agent_type, registered)
+            for agent_type, registered in self._agents.items()
+            if agent_type is not agent.agent_type
+        ]
+        others.insert(position, (agent.agent_type, agent))
+        self._agents = dict(others)
 
     def get_agent(self, agent_type: AgentType) -> Optional[BaseMLOpsAgent]:
         """Get an agent by type."""
         return self._agents.get(agent_type)
 
-    def get_execution_order(self) -> List[AgentType]:
+    def get_execution_order(self) -> Tuple[AgentType, ...]:
         """Get the defined execution order for agents."""
-        return self._execution_order.copy()
+        return tuple(self._agents)
 
     def list_agents(self) -> Dict[AgentType, str]:
         """List all registered agents."""
@@ -8,8 +8,8 @@ and validation of agent responses.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Literal, Any
-from pydantic import BaseModel, Field
+from typing import Callable, Dict, List, Optional, Literal, Any, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from .constraint_schema import (
     ConstraintExtractionResult,
@@ -17,10 +17,91 @@ from .constraint_schema import (
     AdaptiveQuestioningResult,
 )
 
+SchemaT = TypeVar("SchemaT", bound=Type[BaseModel])
 
+# Mapping of agent types to their output schemas, filled by register_agent_schema
+AGENT_OUTPUT_SCHEMAS: Dict[str, Type[BaseModel]] = {}
+
+
+def register_agent_schema(agent_type: str) -> Callable[[SchemaT], SchemaT]:
+    """
+    Class decorator registering a model as the output schema of an agent type.
+
+    Schemas registered after this module is imported need a call to
+    rebuild_schema_cache() before they can be validated.
+    """
+
+    def decorator(schema_class: SchemaT) -> SchemaT:
+        AGENT_OUTPUT_SCHEMAS[agent_type] = schema_class
+        return schema_class
+
+    return decorator
+
+
+# Constraint-related schemas live in constraint_schema
+register_agent_schema("intake_extract")(ConstraintExtractionResult)
+register_agent_schema("coverage_check")(CoverageAnalysisResult)
+register_agent_schema("adaptive_questions")(AdaptiveQuestioningResult)
+
+# Shared enumerations. Kept as Literal so the JSON schema sent to the LLM
+# lists the allowed values and pydantic-core checks them natively.
+ImpactLevel = Literal["Low", "Medium", "High", "Very High"]
+ComplianceStatus = Literal["pass", "warn", "fail"]
+AuditReadiness = Literal["ready", "needs_work", "not_ready"]
+
+# Agent outputs are write-once: produced by the LLM, then only read.
+# Unknown keys emitted by the LLM are dropped.
+_OUTPUT_CFG = ConfigDict(frozen=True, extra="ignore")
+# Line items keep any extra keys the LLM adds alongside the typed ones.
+_ITEM_CFG = ConfigDict(frozen=True, extra="allow")
+
+
+class ServiceCost(BaseModel):
+    """Monthly cost of a single cloud service."""
+
+    model_config = _ITEM_CFG
+
+    service: str = Field(description="Cloud service name")
+    cost: float = Field(description="Estimated monthly cost in USD")
+    description: str = Field(default="", description="What the cost covers")
+
+
+class ComponentCost(BaseModel):
+    """Monthly cost of an infrastructure or operational component."""
+
+    model_config = _ITEM_CFG
+
+    component: str = Field(description="Component name")
+    cost: float = Field(description="Estimated monthly cost in USD")
+    details: str = Field(default="", description="Services or work included")
+
+
+class BudgetAlert(BaseModel):
+    """Recommended budget alert."""
+
+    model_config = _ITEM_CFG
+
+    threshold: float = Field(description="Monthly spend in USD that triggers the alert")
+    type: str = Field(description="Alert severity, e.g. warning or critical")
+    action: str = Field(default="", description="Recommended response")
+
+
+class PolicyRuleResult(BaseModel):
+    """Outcome of evaluating a single policy rule."""
+
+    model_config = _ITEM_CFG
+
+    rule: str = Field(description="Policy rule identifier")
+    status: ComplianceStatus = Field(description="Rule evaluation result")
+    details: str = Field(default="", description="Explanation of the result")
+
+
+@register_agent_schema("planner")
 class PlannerOutput(BaseModel):
     """Structured output for the Planner Agent."""
 
+    model_config = _OUTPUT_CFG
+
     # Pattern selection
     selected_pattern_id: str = Field(
         description="ID of the selected MLOps capability pattern"
@@ -72,9 +153,12 @@ class PlannerOutput(BaseModel):
     )
 
 
+@register_agent_schema("critic_tech")
 class TechCriticOutput(BaseModel):
     """Structured output for the Tech Critic Agent."""
 
+    model_config = _OUTPUT_CFG
+
     # Overall assessment
     technical_feasibility_score: float = Field(
         ge=0.0, le=1.0, description="Overall technical feasibility score"
@@ -143,15 +227,11 @@ class TechCriticOutput(BaseModel):
     )
 
     # Impact assessments
-    availability_impact: Literal["Low", "Medium", "High", "Very High"] = Field(
+    availability_impact: ImpactLevel = Field(
         description="Impact on system availability"
     )
-    performance_impact: Literal["Low", "Medium", "High", "Very High"] = Field(
-        description="Impact on system performance"
-    )
-    security_impact: Literal["Low", "Medium", "High", "Very High"] = Field(
-        description="Impact on system security"
-    )
+    performance_impact: ImpactLevel = Field(description="Impact on system performance")
+    security_impact: ImpactLevel = Field(description="Impact on system security")
 
     # Confidence and caveats
     analysis_assumptions: List[str] = Field(
@@ -162,9 +242,12 @@ class TechCriticOutput(BaseModel):
     )
 
 
+@register_agent_schema("critic_cost")
 class CostCriticOutput(BaseModel):
     """Structured output for the Cost Critic Agent."""
 
+    model_config = _OUTPUT_CFG
+
     # Cost summary
     estimated_monthly_cost: float = Field(
         ge=0.0, description="Total estimated monthly cost in USD"
@@ -177,13 +260,13 @@ class CostCriticOutput(BaseModel):
     )
 
     # Detailed breakdown
-    service_costs: List[Dict[str, Any]] = Field(
+    service_costs: List[ServiceCost] = Field(
         description="Detailed cost breakdown by service"
     )
-    infrastructure_costs: List[Dict[str, Any]] = Field(
+    infrastructure_costs: List[ComponentCost] = Field(
         description="Infrastructure-specific cost items"
     )
-    operational_costs: List[Dict[str, Any]] = Field(
+    operational_costs: List[ComponentCost] = Field(
         description="Operational and maintenance costs"
     )
 
@@ -199,7 +282,7 @@ class CostCriticOutput(BaseModel):
     )
 
     # Budget analysis
-    budget_compliance_status: Literal["pass", "warn", "fail"] = Field(
+    budget_compliance_status: ComplianceStatus = Field(
         description="Compliance with stated budget constraints"
     )
     budget_utilization: float = Field(
@@ -255,7 +338,7 @@ class CostCriticOutput(BaseModel):
     cost_monitoring_strategy: List[str] = Field(
         description="Recommended cost monitoring approaches"
     )
-    budget_alerts_recommended: List[Dict[str, Any]] = Field(
+    budget_alerts_recommended: List[BudgetAlert] = Field(
         description="Recommended budget alerts and thresholds"
     )
     cost_governance_needs: List[str] = Field(description="Cost governance requirements")
@@ -270,11 +353,14 @@ class CostCriticOutput(BaseModel):
     )
 
 
+@register_agent_schema("policy_engine")
 class PolicyEngineOutput(BaseModel):
     """Structured output for the Policy Engine Agent."""
 
+    model_config = _OUTPUT_CFG
+
     # Overall compliance status
-    overall_compliance_status: Literal["pass", "warn", "fail"] = Field(
+    overall_compliance_status: ComplianceStatus = Field(
         description="Overall policy compliance status"
     )
     compliance_score: float = Field(
@@ -285,7 +371,7 @@ class PolicyEngineOutput(BaseModel):
     )
 
     # Rule-by-rule evaluation
-    policy_rule_results: List[Dict[str, Any]] = Field(
+    policy_rule_results: List[PolicyRuleResult] = Field(
         description="Detailed results for each policy rule"
     )
     critical_violations: List[str] = Field(
@@ -312,9 +398,7 @@ class PolicyEngineOutput(BaseModel):
         description="Assessment against regulatory requirements"
     )
     compliance_gaps: List[str] = Field(description="Identified compliance gaps")
-    audit_readiness: Literal["ready", "needs_work", "not_ready"] = Field(
-        description="Assessment of audit readiness"
-    )
+    audit_readiness: AuditReadiness = Field(description="Assessment of audit readiness")
 
     # Risk assessment
     compliance_risks: List[str] = Field(
@@ -392,16 +476,31 @@ AgentStructuredOutput = (
 )
 
 
-# Mapping of agent types to their output schemas
-AGENT_OUTPUT_SCHEMAS = {
-    "intake_extract": ConstraintExtractionResult,
-    "coverage_check": CoverageAnalysisResult,
-    "adaptive_questions": AdaptiveQuestioningResult,
-    "planner": PlannerOutput,
-    "critic_tech": TechCriticOutput,
-    "critic_cost": CostCriticOutput,
-    "policy_engine": PolicyEngineOutput,
-}
+# Validators compiled once per schema; reused for every validation call
+_ADAPTERS: Dict[str, TypeAdapter] = {}
+# List validators for batch validation; one call validates every row
+_LIST_ADAPTERS: Dict[str, TypeAdapter] = {}
+# Error message for unknown agent types, built once
+_UNKNOWN_AGENT_TYPE = ""
+
+
+def rebuild_schema_cache() -> None:
+    """Rebuild cached validators for all registered schemas."""
+    global _UNKNOWN_AGENT_TYPE
+
+    _ADAPTERS.clear()
+    _LIST_ADAPTERS.clear()
+    for agent_type, schema_class in AGENT_OUTPUT_SCHEMAS.items():
+        _ADAPTERS[agent_type] = TypeAdapter(schema_class)
+        _LIST_ADAPTERS[agent_type] = TypeAdapter(List[schema_class])
+
+    available_types = ", ".join(AGENT_OUTPUT_SCHEMAS)
+    _UNKNOWN_AGENT_TYPE = (
+        f"Unknown agent type: {{}}. Available types: {available_types}"
+    )
+
+
+rebuild_schema_cache()
 
 
 def get_agent_output_schema(agent_type: str) -> type[BaseModel]:
@@ -417,13 +516,10 @@ def get_agent_output_schema(agent_type: str) -> type[BaseModel]:
     Raises:
         ValueError: If agent type is not recognized
     """
-    if agent_type not in AGENT_OUTPUT_SCHEMAS:
-        available_types = ", ".join(AGENT_OUTPUT_SCHEMAS.keys())
-        raise ValueError(
-            f"Unknown agent type: {agent_type}. Available types: {available_types}"
-        )
-
-    return AGENT_OUTPUT_SCHEMAS[agent_type]
+    try:
+        return AGENT_OUTPUT_SCHEMAS[agent_type]
+    except KeyError:
+        raise ValueError(_UNKNOWN_AGENT_TYPE.format(agent_type)) from None
 
 
 def validate_agent_output(agent_type: str, output_data: Dict[str, Any]) -> BaseModel:
@@ -441,5 +537,35 @@ def validate_agent_output(agent_type: str, output_data: Dict[str, Any]) -> BaseM
         ValueError: If agent type is not recognized
         ValidationError: If output data doesn't match schema
     """
-    schema_class = get_agent_output_schema(agent_type)
-    return schema_class.model_validate(output_data)
+    try:
+        adapter = _ADAPTERS[agent_type]
+    except KeyError:
+        raise ValueError(_UNKNOWN_AGENT_TYPE.format(agent_type)) from None
+    return adapter.validate_python(output_data)
+
+
+def validate_agent_outputs(
+    agent_type: str, rows: List[Dict[str, Any]]
+) -> List[BaseModel]:
+    """
+    Validate a batch of agent outputs against the expected schema.
+
+    Prefer this over calling validate_agent_output per item when validating
+    more than a handful of outputs; the whole list is validated in one call.
+
+    Args:
+        agent_type: The agent type identifier
+        rows: Raw output data items to validate
+
+    Returns:
+        Validated Pydantic model instances, in input order
+
+    Raises:
+        ValueError: If agent type is not recognized
+        ValidationError: If any item doesn't match schema
+    """
+    try:
+        adapter = _LIST_ADAPTERS[agent_type]
+    except KeyError:
+        raise ValueError(_UNKNOWN_AGENT_TYPE.format(agent_type)) from None
+    return adapter.validate_python(rows)
@@ -0,0 +1,108 @@
+"""
+Shared helpers for the code generation services.
+
+Used by both the Claude Code SDK and the OpenAI implementations, so this
+module must not import either provider's SDK.
+"""
+
+import os
+from functools import lru_cache
+from typing import Iterator
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+# Multipart upload settings for repository ZIPs: archives under one chunk go
+# up in a single PUT, larger ones upload their parts in parallel (8 MiB
+# parts, 10 in flight)
+_MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNK_BYTES,
+    multipart_chunksize=_MULTIPART_CHUNK_BYTES,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# boto3 clients are thread-safe; one is shared by every service instance,
+# since client creation loads service models and each client owns its own
+# connection pool. The pool covers the multipart upload's concurrent part
+# transfers, and keepalive keeps pooled connections usable between
+# generations.
+_S3_CLIENT = None
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+
+def get_s3_client():
+    """Return the process-wide S3 client, creating it on first use."""
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client("s3", config=_S3_CLIENT_CONFIG)
+    return _S3_CLIENT
+
+
+# Artifact kind lookup tables for classify_path. When a file matches several
+# kinds (e.g. terraform/README.md), the earliest in _KIND_PRIORITY wins.
+_KIND_PRIORITY = (
+    "infrastructure",
+    "application",
+    "ci_cd",
+    "documentation",
+    "configuration",
+)
+_EXT_KIND = {
+    ".tf": "infrastructure",
+    ".py": "application",
+    ".js": "application",
+    ".go": "application",
+    ".java": "application",
+    ".md": "documentation",
+    ".yaml": "configuration",
+    ".yml": "configuration",
+    ".json": "configuration",
+    ".env": "configuration",
+}
+_DIR_KIND = {
+    "terraform": "infrastructure",
+    ".github": "ci_cd",
+    "docs": "documentation",
+    "config": "configuration",
+}
+
+
+@lru_cache(maxsize=4096)
+def classify_path(file_path: str) -> str:
+    """Classify a relative artifact path; generated layouts repeat across runs."""
+    *dirs, name = file_path.lower().replace(os.sep, "/").split("/")
+    stem, ext = os.path.splitext(name)
+
+    # Dotfiles such as ".env" have no extension; look them up by name
+    kinds = {_EXT_KIND.get(ext or stem)}
+    kinds.update(_DIR_KIND.get(part) for part in dirs)
+    if stem == "readme":
+        kinds.add("documentation")
+    elif stem in ("ci", "cd"):
+        kinds.add("ci_cd")
+
+    for kind in _KIND_PRIORITY:
+        if kind in kinds:
+            return kind
+    return "other"
+
+
+def iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Recursively yield regular file entries under root using os.scandir.
+
+    Symlinks are not followed, so nothing outside root is scanned or zipped,
+    and entry.stat() is served from an lstat cached on the entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
@@ -7,11 +7,57 @@ configuration. Supports both Claude Code SDK and OpenAI implementations.
 
 import logging
 import os
-from typing import Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from libs.codegen_service import CodegenService
+    from libs.codegen_service_openai import OpenAICodegenService
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_provider() -> Tuple[str, bool, bool]:
+    """Read provider configuration: (provider, has_anthropic, has_openai)."""
+    provider = os.getenv("CODEGEN_PROVIDER", "auto").lower()
+    has_anthropic = bool(os.getenv("ANTHROPIC_API_KEY"))
+    has_openai = bool(os.getenv("OPENAI_API_KEY"))
+    return provider, has_anthropic, has_openai
+
+
+def _make_claude(has_api_key: bool) -> "CodegenService":
+    if not has_api_key:
+        raise ValueError(
+            "CODEGEN_PROVIDER=claude but ANTHROPIC_API_KEY not set. "
+            "Either set the API key or use CODEGEN_PROVIDER=openai"
+        )
+
+    try:
+        from libs.codegen_service import CodegenService
+
+        logger.info("Using Claude Code SDK for code generation")
+        return CodegenService()
+    except ImportError as e:
+        logger.warning(f"Failed to import Claude Code SDK: {e}")
+        raise ValueError(
+            "Claude Code SDK not available. Install with: uv add claude-code-sdk"
+        )
+
+
+def _make_openai(has_api_key: bool) -> "OpenAICodegenService":
+    if not has_api_key:
+        raise ValueError(
+            "CODEGEN_PROVIDER=openai but OPENAI_API_KEY not set. "
+            "Either set the API key or use CODEGEN_PROVIDER=claude"
+        )
+
+    from libs.codegen_service_openai import OpenAICodegenService
+
+    logger.info("Using OpenAI API for code generation")
+    return OpenAICodegenService()
+
+
+@lru_cache(maxsize=1)
 def get_codegen_service() -> Union["CodegenService", "OpenAICodegenService"]:
     """
     Get the appropriate code generation service based on configuration.
@@ -21,19 +67,19 @@ def get_codegen_service() -> Union["CodegenService", "OpenAICodegenService"]:
     - "openai": Use OpenAI API (requires OPENAI_API_KEY)
     - Not set: Auto-detect based on available API keys
 
+    The service is created once and reused; call
+    ``get_codegen_service.cache_clear()`` after changing the configuration.
+
     Returns:
         CodegenService or OpenAICodegenService instance
 
     Raises:
         ValueError: If no valid provider is configured or API keys are missing
     """
-    provider = os.getenv("CODEGEN_PROVIDER", "auto").lower()
+    provider, has_anthropic, has_openai = _resolve_provider()
 
     # Auto-detect provider based on available API keys
     if provider == "auto":
-        has_anthropic = bool(os.getenv("ANTHROPIC_API_KEY"))
-        has_openai = bool(os.getenv("OPENAI_API_KEY"))
-
         if has_anthropic:
             provider = "claude"
             logger.info("Auto-detected Claude Code SDK (ANTHROPIC_API_KEY found)")
@@ -47,58 +93,26 @@ def get_codegen_service() -> Union["CodegenService", "OpenAICodegenService"]:
 
     # Create appropriate service
     if provider == "claude":
-        anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-        if not anthropic_key:
-            raise ValueError(
-                "CODEGEN_PROVIDER=claude but ANTHROPIC_API_KEY not set. "
-                "Either set the API key or use CODEGEN_PROVIDER=openai"
-            )
-
-        try:
-            from libs.codegen_service import CodegenService
-
-            logger.info("Using Claude Code SDK for code generation")
-            return CodegenService()
-        except ImportError as e:
-            logger.warning(f"Failed to import Claude Code SDK: {e}")
-            raise ValueError(
-                "Claude Code SDK not available. Install with: uv add claude-code-sdk"
-            )
-
-    elif provider == "openai":
-        openai_key = os.getenv("OPENAI_API_KEY")
-        if not openai_key:
-            raise ValueError(
-                "CODEGEN_PROVIDER=openai but OPENAI_API_KEY not set. "
-                "Either set the API key or use CODEGEN_PROVIDER=claude"
-            )
-
-        from libs.codegen_service_openai import OpenAICodegenService
-
-        logger.info("Using OpenAI API for code generation")
-        return OpenAICodegenService()
-
-    else:
-        raise ValueError(
-            f"Invalid CODEGEN_PROVIDER: {provider}. Must be 'claude', 'openai', or 'auto'"
-        )
+        return _make_claude(has_anthropic)
+    if provider == "openai":
+        return _make_openai(has_openai)
 
+    raise ValueError(
+        f"Invalid CODEGEN_PROVIDER: {provider}. Must be 'claude', 'openai', or 'auto'"
+    )
 
-def get_provider_info() -> dict:
-    """
-    Get information about the current code generation provider.
 
-    Returns:
-        Dict with provider name, availability, and configuration status
-    """
-    provider = os.getenv("CODEGEN_PROVIDER", "auto")
-    has_anthropic = bool(os.getenv("ANTHROPIC_API_KEY"))
-    has_openai = bool(os.getenv("OPENAI_API_KEY"))
+@lru_cache(maxsize=1)
+def _provider_info() -> Dict[str, Any]:
+    """Resolve provider information once; callers get copies."""
+    provider, has_anthropic, has_openai = _resolve_provider()
 
     # Determine active provider
     active_provider = provider
     if provider == "auto":
-        active_provider = "claude" if has_anthropic else "openai" if has_openai else None
+        active_provider = (
+            "claude" if has_anthropic else "openai" if has_openai else None
+        )
 
     return {
         "configured_provider": provider,
@@ -107,3 +121,17 @@ def get_provider_info() -> dict:
         "openai_available": has_openai,
         "auto_detection": provider == "auto",
     }
+
+
+def get_provider_info() -> dict:
+    """
+    Get information about the current code generation provider.
+
+    Resolution is cached; call ``_provider_info.cache_clear()`` after
+    changing the configuration. Each call returns a fresh dict, so callers
+    may modify it.
+
+    Returns:
+        Dict with provider name, availability, and configuration status
+    """
+    return dict(_provider_info())
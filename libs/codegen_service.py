@@ -6,23 +6,387 @@ using Claude Code SDK to generate complete infrastructure and application code.
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
 import tempfile
 import shutil
+import time
 import zipfile
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-import boto3
-from botocore.exceptions import ClientError
+import backoff
+import claude_code_sdk
+from botocore.exceptions import BotoCoreError, ClientError
 from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
 
+from libs.codegen_common import (
+    TRANSFER_CONFIG,
+    classify_path,
+    get_s3_client,
+    iter_files,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Plan fields that determine the generated repository; identical values share
+# one cached result when CODEGEN_PLAN_CACHE=1
+_PLAN_CACHE_FIELDS = (
+    "pattern_name",
+    "architecture_type",
+    "key_services",
+    "implementation_phases",
+    "estimated_monthly_cost",
+)
+_PLAN_CACHE_MAX_ENTRIES = 128
+# Cached repositories older than this are regenerated
+# (override with CODEGEN_PLAN_CACHE_TTL_SECONDS)
+_PLAN_CACHE_TTL_SECONDS = 24 * 60 * 60
+# The plan cache is best-effort: S3 or manifest errors mean a miss (on load)
+# or a skipped store, never a failed generation
+_PLAN_CACHE_ERRORS = (ClientError, BotoCoreError, ValueError, KeyError)
+
+
+def _plan_fingerprint(plan: Dict[str, Any]) -> str:
+    """Return a stable hash of the plan fields that drive code generation."""
+    canonical = json.dumps(
+        {field: plan.get(field) for field in _PLAN_CACHE_FIELDS},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# SDK failures worth retrying; older SDK releases lack the typed errors.
+# A missing CLI is permanent, so it is never retried, and neither is a
+# component timeout: another full-length attempt would only repeat it.
+_TRANSIENT_SDK_ERRORS = (ConnectionError,) + tuple(
+    getattr(claude_code_sdk, name)
+    for name in ("CLIConnectionError", "ProcessError")
+    if hasattr(claude_code_sdk, name)
+)
+_CLI_NOT_FOUND = getattr(claude_code_sdk, "CLINotFoundError", ())
+
+
+# Marks a plan field that is absent, as opposed to present with value None
+_MISSING: Any = object()
+
+
+@dataclass(frozen=True, slots=True)
+class _PlanView:
+    """Plan fields used by the prompt builders, read from the plan dict once.
+
+    Absent fields hold _MISSING and each prompt applies its own default via
+    field(), exactly like ``plan.get(key, default)``; a field present as None
+    stays None.
+    """
+
+    pattern_name: Any
+    architecture_type: Any
+    services: Optional[Tuple[Tuple[str, Any], ...]]
+    phases: Any
+    cost_budget: Any
+
+    @classmethod
+    def from_plan(cls, plan: Dict[str, Any]) -> "_PlanView":
+        # key_services=None only breaks the prompts that read services
+        key_services = plan.get("key_services", {})
+        services = tuple(key_services.items()) if key_services is not None else None
+        phases = plan.get("implementation_phases", _MISSING)
+        if phases is not _MISSING and phases is not None:
+            phases = tuple(phases)
+        return cls(
+            pattern_name=plan.get("pattern_name", _MISSING),
+            architecture_type=plan.get("architecture_type", _MISSING),
+            services=services,
+            phases=phases,
+            cost_budget=plan.get("estimated_monthly_cost", _MISSING),
+        )
+
+    def field(self, name: str, default: Any) -> Any:
+        value = getattr(self, name)
+        return default if value is _MISSING else value
+
+    def service(self, name: str, default: str) -> Any:
+        for service_name, description in self.services:
+            if service_name == name:
+                return description
+        return default
+
+
+def _best_temp_dir() -> Optional[str]:
+    """Return /dev/shm for generation workspaces when CODEGEN_USE_TMPFS=1.
+
+    Keeps generated sources in RAM instead of on slow container disks.
+    Returns None (the system default) when disabled or not writable.
+    """
+    if os.getenv("CODEGEN_USE_TMPFS", "0") != "1":
+        return None
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    logger.warning("CODEGEN_USE_TMPFS=1 but /dev/shm is not writable; using default")
+    return None
+
+
+# Component system prompts. They never depend on the plan, so every session
+# starts with an identical prefix that the Claude Code CLI can prompt-cache;
+# plan details only appear in the short per-component user prompt.
+_APPLICATION_SYSTEM_PROMPT = (
+    "You are an expert Python developer specializing in FastAPI and ML services."
+)
+_INFRASTRUCTURE_SYSTEM_PROMPT = (
+    "You are an expert DevOps engineer specializing in AWS and Terraform."
+)
+_CICD_SYSTEM_PROMPT = (
+    "You are an expert DevOps engineer specializing in GitHub Actions and CI/CD."
+)
+
+# Terraform resource blocks appended by _generate_terraform_resources
+_TF_LAMBDA_RESOURCES = """
+# Lambda function for serverless compute
+resource "aws_lambda_function" "mlops_function" {
+  filename         = "function.zip"
+  function_name    = "mlops-${var.environment}-function"
+  role            = aws_iam_role.lambda_role.arn
+  handler         = "main.handler"
+  runtime         = "python3.11"
+  timeout         = 300
+
+  tags = {
+    Environment = var.environment
+    Purpose     = "MLOps"
+  }
+}
+
+resource "aws_iam_role" "lambda_role" {
+  name = "mlops-${var.environment}-lambda-role"
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "lambda.amazonaws.com"
+        }
+      }
+    ]
+  })
+}"""
+
+_TF_S3_RESOURCES = """
+# S3 bucket for data storage
+resource "aws_s3_bucket" "mlops_data" {
+  bucket = "mlops-${var.environment}-data-${random_id.bucket_suffix.hex}"
+  
+  tags = {
+    Environment = var.environment
+    Purpose     = "MLOps Data"
+  }
+}
+
+resource "random_id" "bucket_suffix" {
+  byte_length = 4
+}"""
+
+
+def _mentions_serverless(services: Dict[str, Any]) -> bool:
+    """Whether any service name or description mentions serverless.
+
+    Checks each entry instead of lowercasing the repr of the whole dict.
+    """
+    return any(
+        "serverless" in str(name).lower() or "serverless" in str(desc).lower()
+        for name, desc in services.items()
+    )
+
+
+# Fallback templates, filled with str.format_map (literal braces are doubled)
+_TERRAFORM_TEMPLATE = """# MLOps Infrastructure - {pattern_name}
+# Generated by Agentic MLOps Platform
+
+terraform {{
+  required_version = ">= 1.0"
+  required_providers {{
+    aws = {{
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }}
+  }}
+}}
+
+provider "aws" {{
+  region = var.aws_region
+}}
+
+variable "aws_region" {{
+  description = "AWS region for resources"
+  type        = string
+  default     = "us-east-1"
+}}
+
+variable "environment" {{
+  description = "Environment name"
+  type        = string
+  default     = "dev"
+}}
+
+# Core infrastructure components
+{resources}
+
+output "infrastructure_info" {{
+  description = "Infrastructure deployment information"
+  value = {{
+    region      = var.aws_region
+    environment = var.environment
+    services    = {services}
+  }}
+}}
+"""
+
+_APP_TEMPLATE = '''"""
+MLOps Application - {pattern_name}
+Generated by Agentic MLOps Platform
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Any
+
+# Configure logging
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
 logger = logging.getLogger(__name__)
 
 
+class MLOpsApplication:
+    """Main MLOps application class."""
+    
+    def __init__(self):
+        self.config = self.load_config()
+        logger.info("MLOps application initialized")
+    
+    def load_config(self) -> Dict[str, Any]:
+        """Load application configuration."""
+        return {{
+            "environment": os.getenv("ENVIRONMENT", "dev"),
+            "aws_region": os.getenv("AWS_REGION", "us-east-1"),
+            "services": {services},
+            "initialized_at": datetime.utcnow().isoformat()
+        }}
+    
+    def run(self):
+        """Run the main application logic."""
+        logger.info("Starting MLOps application")
+        
+        # Application logic here
+        logger.info("MLOps application running successfully")
+
+
+def handler(event, context):
+    """Lambda handler function."""
+    app = MLOpsApplication()
+    app.run()
+    
+    return {{
+        "statusCode": 200,
+        "body": "MLOps application executed successfully"
+    }}
+
+
+if __name__ == "__main__":
+    app = MLOpsApplication()
+    app.run()
+'''
+
+_CI_TEMPLATE = """# MLOps CI/CD Pipeline - {pattern_name}
+# Generated by Agentic MLOps Platform
+
+name: MLOps CI/CD
+
+on:
+  push:
+    branches: [ main, develop ]
+  pull_request:
+    branches: [ main ]
+
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    
+    steps:
+    - uses: actions/checkout@v4
+    
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.11'
+    
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install -r requirements.txt
+        pip install pytest ruff
+    
+    - name: Lint with ruff
+      run: |
+        ruff check .
+        ruff format --check .
+    
+    - name: Test with pytest
+      run: |
+        pytest -v
+    
+    - name: Terraform validate
+      uses: hashicorp/setup-terraform@v2
+      with:
+        terraform_version: 1.5.0
+    
+    - name: Terraform format check
+      run: |
+        cd terraform
+        terraform fmt -check
+        terraform init
+        terraform validate
+
+  deploy:
+    needs: test
+    runs-on: ubuntu-latest
+    if: github.ref == 'refs/heads/main'
+    
+    steps:
+    - uses: actions/checkout@v4
+    
+    - name: Configure AWS credentials
+      uses: aws-actions/configure-aws-credentials@v2
+      with:
+        aws-access-key-id: ${{{{ secrets.AWS_ACCESS_KEY_ID }}}}
+        aws-secret-access-key: ${{{{ secrets.AWS_SECRET_ACCESS_KEY }}}}
+        aws-region: us-east-1
+    
+    - name: Deploy infrastructure
+      run: |
+        cd terraform
+        terraform init
+        terraform plan
+        terraform apply -auto-approve
+    
+    - name: Deploy application
+      run: |
+        # Application deployment logic here
+        echo "Deploying MLOps application..."
+"""
+
+
 class CodegenService:
     """Service for generating and managing MLOps code artifacts."""
 
@@ -30,10 +394,23 @@ class CodegenService:
         self.s3_client = None
         self.s3_bucket = os.getenv("S3_BUCKET_NAME")
         self._claude_timeout = int(os.getenv("CLAUDE_CODE_TIMEOUT_SECONDS", "60"))
+        self._claude_max_concurrency = int(
+            os.getenv("CLAUDE_CODE_MAX_CONCURRENCY", "3")
+        )
+        # Deflate level for repository ZIPs. The default of 1 is much faster
+        # than zlib's 6 on generated source for a few percent larger archives
+        self._zip_level = int(os.getenv("CODEGEN_ZIP_LEVEL", "1"))
+        self._temp_root = _best_temp_dir()
+        self._plan_cache_enabled = os.getenv("CODEGEN_PLAN_CACHE", "0") == "1"
+        self._plan_cache_ttl = int(
+            os.getenv("CODEGEN_PLAN_CACHE_TTL_SECONDS", str(_PLAN_CACHE_TTL_SECONDS))
+        )
+        # fingerprint -> (stored_at epoch seconds, generation result)
+        self._plan_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
         if self.s3_bucket:
             try:
-                self.s3_client = boto3.client("s3")
+                self.s3_client = get_s3_client()
             except Exception as e:
                 logger.warning(f"Failed to initialize S3 client: {e}")
 
@@ -55,136 +432,288 @@ class CodegenService:
             },
         )
 
+        # Structurally identical plans reuse a previously generated repository
+        fingerprint = None
+        if self._plan_cache_enabled:
+            fingerprint = _plan_fingerprint(plan)
+            cached = await self._load_cached_result(fingerprint)
+            if cached is not None:
+                logger.info(
+                    "Reusing cached MLOps repository",
+                    extra={"plan_fingerprint": fingerprint},
+                )
+                return cached
+
+        # One timestamp for every artifact produced in this generation pass
+        generated_at = datetime.now(timezone.utc).isoformat()
+
         try:
             # Create temporary directory for generated code
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=self._temp_root) as temp_dir:
                 temp_path = Path(temp_dir)
 
                 # Generate code using Claude Code SDK
-                artifacts = await self._generate_code_with_claude(plan, temp_path)
+                artifacts, complete = await self._generate_code_with_claude(
+                    plan, temp_path, now_iso=generated_at
+                )
 
                 # Create reports directory
                 reports_dir = temp_path / "reports"
                 reports_dir.mkdir(exist_ok=True)
 
-                # Create repository ZIP
-                zip_path = temp_path / "mlops_repository.zip"
-                zip_key = await self._create_repository_zip(temp_path, zip_path, plan)
+                # Create repository ZIP directly in the artifacts directory so
+                # persisting it is a rename rather than a second full copy
+                zip_path = self._artifacts_dir() / f".{temp_path.name}.zip.partial"
+                try:
+                    zip_key = await self._create_repository_zip(
+                        temp_path, zip_path, plan
+                    )
+
+                    # Persist ZIP locally for download
+                    persisted_zip = self._persist_zip(zip_path, zip_key)
+                finally:
+                    zip_path.unlink(missing_ok=True)
 
-                # Persist ZIP locally for download
-                persisted_zip = self._persist_zip(zip_path, zip_key)
+                try:
+                    size_bytes = os.stat(persisted_zip).st_size
+                except FileNotFoundError:
+                    size_bytes = 0
 
                 # Upload to S3 if available
                 s3_url = None
                 if self.s3_client and self.s3_bucket:
-                    s3_url = await self._upload_to_s3(zip_path, zip_key)
+                    s3_url = await self._upload_to_s3(persisted_zip, zip_key)
 
-                return {
+                result = {
                     "artifacts": artifacts,
                     "repository_zip": {
                         "local_path": str(persisted_zip),
                         "s3_url": s3_url,
                         "zip_key": zip_key,
-                        "size_bytes": persisted_zip.stat().st_size
-                        if persisted_zip.exists()
-                        else 0,
+                        "size_bytes": size_bytes,
                     },
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "generated_at": generated_at,
                     "plan_used": plan.get("pattern_name", "unknown"),
                 }
 
+                # Template fallbacks and runs with a failed component are not
+                # cached so a later request can still get the full repository
+                if fingerprint and complete and artifacts:
+                    await self._store_cached_result(fingerprint, result)
+
+                return result
+
         except Exception as e:
             logger.exception("Failed to generate MLOps repository")
             raise CodegenError(f"Repository generation failed: {str(e)}")
 
-    def _persist_zip(self, zip_path: Path, zip_key: str) -> Path:
+    async def _load_cached_result(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached generation result in memory, then in S3.
+
+        Entries past the TTL, or whose repository ZIP is gone and cannot be
+        fetched back from S3, count as misses.
+        """
+        entry = self._plan_cache.get(fingerprint)
+        if entry is None and self.s3_client and self.s3_bucket:
+            try:
+                entry = await asyncio.to_thread(self._get_s3_manifest, fingerprint)
+            except _PLAN_CACHE_ERRORS as e:
+                missing = isinstance(e, ClientError) and e.response.get(
+                    "Error", {}
+                ).get("Code") in ("NoSuchKey", "404")
+                if not missing:
+                    logger.warning(f"Failed to read cached repository manifest: {e}")
+                return None
+            self._remember_result(fingerprint, *entry)
+        if entry is None:
+            return None
+
+        stored_at, cached = entry
+        if time.time() - stored_at > self._plan_cache_ttl:
+            self._plan_cache.pop(fingerprint, None)
+            return None
+
+        cached = copy.deepcopy(cached)
+        try:
+            restored = await self._restore_cached_zip(cached["repository_zip"])
+        except _PLAN_CACHE_ERRORS as e:
+            logger.warning(f"Ignoring unusable cached repository: {e}")
+            restored = False
+        if not restored:
+            self._plan_cache.pop(fingerprint, None)
+            return None
+        return cached
+
+    async def _restore_cached_zip(self, repository_zip: Dict[str, Any]) -> bool:
+        """Make sure a cached repository ZIP is on local disk for download."""
+        zip_key = repository_zip["zip_key"]
+        local_path = self._artifacts_dir() / zip_key
+        if not local_path.exists():
+            if not (repository_zip.get("s3_url") and self.s3_client and self.s3_bucket):
+                return False
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.download_file,
+                    self.s3_bucket,
+                    f"artifacts/{zip_key}",
+                    str(local_path),
+                    Config=TRANSFER_CONFIG,
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(f"Failed to restore cached repository ZIP: {e}")
+                return False
+        repository_zip["local_path"] = str(local_path)
+        return True
+
+    async def _store_cached_result(
+        self, fingerprint: str, result: Dict[str, Any]
+    ) -> None:
+        """Cache a generation result in memory and, if configured, in S3."""
+        self._remember_result(fingerprint, time.time(), copy.deepcopy(result))
+        if not (self.s3_client and self.s3_bucket):
+            return
+        try:
+            await asyncio.to_thread(
+                self.s3_client.put_object,
+                Bucket=self.s3_bucket,
+                Key=f"artifacts/cache/{fingerprint}.json",
+                Body=json.dumps(result).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except _PLAN_CACHE_ERRORS as e:
+            logger.warning(f"Failed to store cached repository manifest: {e}")
+
+    def _get_s3_manifest(self, fingerprint: str) -> Tuple[float, Dict[str, Any]]:
+        response = self.s3_client.get_object(
+            Bucket=self.s3_bucket, Key=f"artifacts/cache/{fingerprint}.json"
+        )
+        return response["LastModified"].timestamp(), json.loads(response["Body"].read())
+
+    def _remember_result(
+        self, fingerprint: str, stored_at: float, result: Dict[str, Any]
+    ) -> None:
+        if len(self._plan_cache) >= _PLAN_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[fingerprint] = (stored_at, result)
+
+    def _artifacts_dir(self) -> Path:
         artifacts_dir = Path(
             os.getenv("ARTIFACTS_DIR", "./artifacts")
         ).resolve()
         artifacts_dir.mkdir(parents=True, exist_ok=True)
-        target_path = artifacts_dir / zip_key
-        shutil.copyfile(zip_path, target_path)
+        return artifacts_dir
+
+    def _persist_zip(self, zip_path: Path, zip_key: str) -> Path:
+        target_path = self._artifacts_dir() / zip_key
+        # A rename when zip_path is already on the artifacts filesystem
+        shutil.move(zip_path, target_path)
         return target_path
 
     async def _generate_code_with_claude(
-        self, plan: Dict[str, Any], output_dir: Path
-    ) -> List[Dict[str, Any]]:
-        """Generate code files using Claude Code SDK."""
-        logger.info("Generating code with Claude Code SDK")
-
-        # Prepare system prompt for MLOps code generation
-        system_prompt = self._create_system_prompt(plan)
+        self, plan: Dict[str, Any], output_dir: Path, now_iso: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Generate code files using Claude Code SDK.
 
-        # Define the generation request
-        generation_prompt = self._create_generation_prompt(plan)
+        Returns the artifacts and whether every component came from Claude
+        (False when a component failed or the template fallback was used).
+        """
+        logger.info("Generating code with Claude Code SDK")
 
         try:
             # Use decomposed approach - generate components separately
-            artifacts = await self._generate_decomposed_components(plan, output_dir)
+            artifacts, complete = await self._generate_decomposed_components(
+                plan, output_dir, now_iso=now_iso
+            )
             logger.info(f"Generated {len(artifacts)} code artifacts using decomposed approach")
-            return artifacts
+            return artifacts, complete
 
         except asyncio.TimeoutError:
             logger.warning("Claude Code SDK timed out; falling back to templates")
-            return await self._fallback_template_generation(plan, output_dir)
+            return await self._fallback_template_generation(plan, output_dir), False
         except Exception:
             logger.exception("Claude Code SDK generation failed")
             # Fallback to template-based generation
-            return await self._fallback_template_generation(plan, output_dir)
+            return await self._fallback_template_generation(plan, output_dir), False
+
+    async def _generate_decomposed_components(
+        self, plan: Dict[str, Any], output_dir: Path, now_iso: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Generate MLOps components using multiple focused Claude Code SDK calls.
 
-    async def _generate_decomposed_components(self, plan: Dict[str, Any], output_dir: Path) -> List[Dict[str, Any]]:
-        """Generate MLOps components using multiple focused Claude Code SDK calls."""
+        Returns the artifacts and whether every component succeeded.
+        """
         artifacts = []
+        complete = True
+        plan_view = _PlanView.from_plan(plan)
 
         # Define components to generate
         components = [
             {
                 "name": "application",
                 "subdir": "src",
-                "system_prompt": "You are an expert Python developer specializing in FastAPI and ML services.",
-                "user_prompt": self._create_application_prompt(plan),
+                "system_prompt": _APPLICATION_SYSTEM_PROMPT,
+                "user_prompt": self._create_application_prompt(plan_view),
                 "timeout": 120
             },
             {
                 "name": "infrastructure",
                 "subdir": "terraform",
-                "system_prompt": "You are an expert DevOps engineer specializing in AWS and Terraform.",
-                "user_prompt": self._create_infrastructure_prompt(plan),
+                "system_prompt": _INFRASTRUCTURE_SYSTEM_PROMPT,
+                "user_prompt": self._create_infrastructure_prompt(plan_view),
                 "timeout": 120
             },
             {
                 "name": "ci_cd",
                 "subdir": ".github/workflows",
-                "system_prompt": "You are an expert DevOps engineer specializing in GitHub Actions and CI/CD.",
-                "user_prompt": self._create_cicd_prompt(plan),
+                "system_prompt": _CICD_SYSTEM_PROMPT,
+                "user_prompt": self._create_cicd_prompt(plan_view),
                 "timeout": 90
             }
         ]
 
-        for component in components:
-            try:
+        # Components write to disjoint subdirectories, so they run concurrently.
+        # The semaphore is per call so it is always bound to the running loop.
+        semaphore = asyncio.Semaphore(self._claude_max_concurrency)
+
+        async def generate(component: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
                 logger.info(f"Generating {component['name']} component")
-                component_artifacts = await self._generate_single_component(
-                    plan, output_dir, component
+                return await self._generate_single_component(
+                    plan, output_dir, component, now_iso=now_iso
                 )
-                artifacts.extend(component_artifacts)
-                logger.info(f"Generated {len(component_artifacts)} files for {component['name']}")
 
-            except Exception as e:
-                logger.warning(f"Failed to generate {component['name']} component: {e}")
+        results = await asyncio.gather(
+            *(generate(component) for component in components),
+            return_exceptions=True,
+        )
+
+        for component, result in zip(components, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to generate {component['name']} component: {result}")
                 # Continue with other components
+                complete = False
+                continue
+            artifacts.extend(result)
+            logger.info(f"Generated {len(result)} files for {component['name']}")
 
-        return artifacts
+        return artifacts, complete
 
     async def _generate_single_component(
-        self, plan: Dict[str, Any], output_dir: Path, component: Dict[str, Any]
+        self,
+        plan: Dict[str, Any],
+        output_dir: Path,
+        component: Dict[str, Any],
+        now_iso: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Generate a single MLOps component using Claude Code SDK."""
         target_dir = output_dir / component["subdir"]
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track files before generation
-        files_before = set(target_dir.glob("**/*"))
+        # Track files before generation (usually none: the subdir is new)
+        files_before = {entry.path for entry in iter_files(str(target_dir))}
 
         options = ClaudeCodeOptions(
             system_prompt=component["system_prompt"],
@@ -193,37 +722,73 @@ class CodegenService:
             allowed_tools=["Write", "Read"],
         )
 
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query(component["user_prompt"])
-
-            # Consume all responses with timeout
-            async def consume_responses():
-                async for message in client.receive_response():
-                    logger.debug(f"Component {component['name']}: {type(message).__name__}")
-
-            await asyncio.wait_for(consume_responses(), timeout=component["timeout"])
+        await self._query_component(component, options, target_dir)
 
-        # Find newly created files
-        files_after = set(target_dir.glob("**/*"))
-        new_files = [f for f in files_after - files_before if f.is_file()]
-
-        # Create artifacts for new files
+        # Create artifacts for newly created files in a single directory walk
+        now_iso = now_iso or datetime.now(timezone.utc).isoformat()
         artifacts = []
-        for file_path in new_files:
-            relative_path = file_path.relative_to(output_dir)
+        for entry in iter_files(str(target_dir)):
+            if entry.path in files_before:
+                continue
+            relative_path = os.path.relpath(entry.path, output_dir)
             artifacts.append({
-                "path": str(relative_path),
-                "kind": self._classify_file_kind(str(relative_path)),
-                "size_bytes": file_path.stat().st_size,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "path": relative_path,
+                "kind": self._classify_file_kind(relative_path),
+                "size_bytes": entry.stat(follow_symlinks=False).st_size,
+                "created_at": now_iso,
             })
 
         return artifacts
 
-    def _create_application_prompt(self, plan: Dict[str, Any]) -> str:
+    @backoff.on_exception(
+        backoff.expo,
+        _TRANSIENT_SDK_ERRORS,
+        max_tries=3,
+        base=2,
+        max_value=60,
+        giveup=lambda e: isinstance(e, _CLI_NOT_FOUND),
+    )
+    async def _query_component(
+        self, component: Dict[str, Any], options: ClaudeCodeOptions, target_dir: Path
+    ) -> None:
+        """Run one component query, retrying transient SDK failures with jitter.
+
+        Files an attempt writes before failing are removed, so a retry starts
+        from the same directory contents and partial output is never packaged.
+        """
+        files_before = {entry.path for entry in iter_files(str(target_dir))}
+        try:
+            async with ClaudeSDKClient(options=options) as client:
+                await client.query(component["user_prompt"])
+
+                # Consume all responses with timeout; only the debug trace looks
+                # at individual messages, so skip formatting when it is disabled.
+                debug = logger.isEnabledFor(logging.DEBUG)
+                name = component["name"]
+
+                async def consume_responses():
+                    async for message in client.receive_response():
+                        if debug:
+                            logger.debug(
+                                "Component %s: %s", name, type(message).__name__
+                            )
+
+                await asyncio.wait_for(
+                    consume_responses(), timeout=component["timeout"]
+                )
+        except Exception:
+            partial = [
+                entry.path
+                for entry in iter_files(str(target_dir))
+                if entry.path not in files_before
+            ]
+            for path in partial:
+                os.unlink(path)
+            raise
+
+    def _create_application_prompt(self, plan_view: _PlanView) -> str:
         """Create prompt for application code generation."""
-        services = plan.get("key_services", {})
-        api_service = services.get("api", "ML inference service")
+        api_service = plan_view.service("api", "ML inference service")
 
         return f"""Create a FastAPI application for {api_service}.
 
@@ -234,10 +799,10 @@ Include:
 
 Keep it production-ready but focused. Include proper error handling and logging."""
 
-    def _create_infrastructure_prompt(self, plan: Dict[str, Any]) -> str:
+    def _create_infrastructure_prompt(self, plan_view: _PlanView) -> str:
         """Create prompt for infrastructure code generation."""
-        architecture = plan.get("architecture_type", "app_runner")
-        budget = plan.get("estimated_monthly_cost", 100)
+        architecture = plan_view.field("architecture_type", "app_runner")
+        budget = plan_view.field("cost_budget", 100)
 
         return f"""Create Terraform configuration for {architecture} architecture.
 
@@ -250,9 +815,9 @@ Include:
 
 Focus on cost-effective, secure AWS resources. Use App Runner for container deployment."""
 
-    def _create_cicd_prompt(self, plan: Dict[str, Any]) -> str:
+    def _create_cicd_prompt(self, plan_view: _PlanView) -> str:
         """Create prompt for CI/CD pipeline generation."""
-        phases = plan.get("implementation_phases", ["build", "test", "deploy"])
+        phases = plan_view.field("phases", ("build", "test", "deploy"))
 
         return f"""Create GitHub Actions workflow for ML service deployment.
 
@@ -270,58 +835,37 @@ Focus on container building, testing, and AWS deployment patterns."""
         """Fallback template-based code generation when Claude SDK fails."""
         logger.warning("Using fallback template generation")
 
-        artifacts = []
-
-        # Generate Terraform infrastructure
-        terraform_dir = output_dir / "terraform"
-        terraform_dir.mkdir(exist_ok=True)
-
-        main_tf = terraform_dir / "main.tf"
-        terraform_content = self._generate_terraform_template(plan)
-        main_tf.write_text(terraform_content)
-
-        artifacts.append(
-            {
-                "path": "terraform/main.tf",
-                "kind": "infrastructure",
-                "size_bytes": len(terraform_content),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-        )
+        now_iso = datetime.now(timezone.utc).isoformat()
 
-        # Generate application code
-        src_dir = output_dir / "src"
-        src_dir.mkdir(exist_ok=True)
+        # Terraform infrastructure, application code and CI/CD configuration
+        files = [
+            ("terraform/main.tf", "infrastructure", self._generate_terraform_template(plan)),
+            ("src/main.py", "application", self._generate_application_template(plan)),
+            (".github/workflows/ci.yml", "ci_cd", self._generate_ci_template(plan)),
+        ]
 
-        main_py = src_dir / "main.py"
-        app_content = self._generate_application_template(plan)
-        main_py.write_text(app_content)
+        def write_file(relative_path: str, content: str) -> None:
+            file_path = output_dir / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
 
-        artifacts.append(
-            {
-                "path": "src/main.py",
-                "kind": "application",
-                "size_bytes": len(app_content),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
+        # Write the files concurrently without blocking the event loop
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(write_file, relative_path, content)
+                for relative_path, _, content in files
+            )
         )
 
-        # Generate CI/CD configuration
-        github_dir = output_dir / ".github" / "workflows"
-        github_dir.mkdir(parents=True, exist_ok=True)
-
-        ci_yaml = github_dir / "ci.yml"
-        ci_content = self._generate_ci_template(plan)
-        ci_yaml.write_text(ci_content)
-
-        artifacts.append(
+        artifacts = [
             {
-                "path": ".github/workflows/ci.yml",
-                "kind": "ci_cd",
-                "size_bytes": len(ci_content),
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "path": relative_path,
+                "kind": kind,
+                "size_bytes": len(content),
+                "created_at": now_iso,
             }
-        )
+            for relative_path, kind, content in files
+        ]
 
         return artifacts
 
@@ -351,16 +895,16 @@ Focus on container building, testing, and AWS deployment patterns."""
         # Final fallback: wrap raw payload so callers can log / inspect it
         return {"type": None, "raw_message": message}
 
-    def _create_system_prompt(self, plan: Dict[str, Any]) -> str:
+    def _create_system_prompt(self, plan_view: _PlanView) -> str:
         """Create system prompt for Claude Code SDK."""
-        pattern_name = plan.get("pattern_name", "MLOps System")
-        architecture_type = plan.get("architecture_type", "hybrid")
-        key_services = plan.get("key_services", {})
+        pattern_name = plan_view.field("pattern_name", "MLOps System")
+        architecture_type = plan_view.field("architecture_type", "hybrid")
+        services_list = ", ".join(name for name, _ in plan_view.services)
 
         return f"""You are an expert MLOps engineer tasked with generating a production-ready {pattern_name}.
 
 Architecture Type: {architecture_type}
-Key Services: {", ".join(key_services.keys())}
+Key Services: {services_list}
 
 Your task is to generate a complete MLOps repository with:
 1. Infrastructure as Code (Terraform) for AWS deployment
@@ -376,16 +920,16 @@ Requirements:
 
 Focus on creating production-quality code that follows MLOps best practices."""
 
-    def _create_generation_prompt(self, plan: Dict[str, Any]) -> str:
+    def _create_generation_prompt(self, plan_view: _PlanView) -> str:
         """Create the main generation prompt."""
-        services = plan.get("key_services", {})
-        phases = plan.get("implementation_phases", [])
-        cost_budget = plan.get("estimated_monthly_cost", 0)
+        cost_budget = plan_view.field("cost_budget", 0)
 
         services_list = "\n".join(
-            [f"- {svc}: {desc}" for svc, desc in services.items()]
+            [f"- {svc}: {desc}" for svc, desc in plan_view.services]
+        )
+        phases_list = "\n".join(
+            [f"- {phase}" for phase in plan_view.field("phases", ())]
         )
-        phases_list = "\n".join([f"- {phase}" for phase in phases])
 
         return f"""Generate a complete MLOps repository with the following specifications:
 
@@ -425,20 +969,7 @@ Generate all necessary files with proper content, following AWS and MLOps best p
 
     def _classify_file_kind(self, file_path: str) -> str:
         """Classify the type of generated file."""
-        path_lower = file_path.lower()
-
-        if "terraform" in path_lower or file_path.endswith(".tf"):
-            return "infrastructure"
-        elif any(ext in path_lower for ext in [".py", ".js", ".go", ".java"]):
-            return "application"
-        elif ".github" in path_lower or "ci" in path_lower:
-            return "ci_cd"
-        elif any(name in path_lower for name in ["readme", "doc", ".md"]):
-            return "documentation"
-        elif any(name in path_lower for name in ["config", ".env", ".yaml", ".json"]):
-            return "configuration"
-        else:
-            return "other"
+        return classify_path(file_path)
 
     async def _scan_generated_files(self, output_dir: Path) -> List[Dict[str, Any]]:
         """Scan directory for generated files."""
@@ -460,17 +991,27 @@ Generate all necessary files with proper content, following AWS and MLOps best p
 
     async def _create_repository_zip(
         self, source_dir: Path, zip_path: Path, plan: Dict[str, Any]
+    ) -> str:
+        """Create a ZIP archive of the generated repository in a worker thread."""
+        return await asyncio.to_thread(
+            self._create_repository_zip_sync, source_dir, zip_path, plan
+        )
+
+    def _create_repository_zip_sync(
+        self, source_dir: Path, zip_path: Path, plan: Dict[str, Any]
     ) -> str:
         """Create a ZIP archive of the generated repository."""
         pattern_name = plan.get("pattern_name", "mlops-project")
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         zip_key = f"{pattern_name.lower().replace(' ', '-')}_{timestamp}.zip"
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob("*"):
-                if file_path.is_file() and file_path != zip_path:
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+        with zipfile.ZipFile(
+            zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=self._zip_level
+        ) as zipf:
+            zip_name = str(zip_path)
+            for entry in iter_files(str(source_dir)):
+                if entry.path != zip_name:
+                    zipf.write(entry.path, os.path.relpath(entry.path, source_dir))
 
         logger.info(f"Created repository ZIP: {zip_key}")
         return zip_key
@@ -478,11 +1019,14 @@ Generate all necessary files with proper content, following AWS and MLOps best p
     async def _upload_to_s3(self, zip_path: Path, zip_key: str) -> Optional[str]:
         """Upload the repository ZIP to S3."""
         try:
-            self.s3_client.upload_file(
+            # upload_file blocks; run it off the event loop
+            await asyncio.to_thread(
+                self.s3_client.upload_file,
                 str(zip_path),
                 self.s3_bucket,
                 f"artifacts/{zip_key}",
                 ExtraArgs={"ContentType": "application/zip"},
+                Config=TRANSFER_CONFIG,
             )
 
             s3_url = f"s3://{self.s3_bucket}/artifacts/{zip_key}"
@@ -497,242 +1041,40 @@ Generate all necessary files with proper content, following AWS and MLOps best p
         """Generate basic Terraform template."""
         services = plan.get("key_services", {})
 
-        return f"""# MLOps Infrastructure - {plan.get("pattern_name", "MLOps System")}
-# Generated by Agentic MLOps Platform
-
-terraform {{
-  required_version = ">= 1.0"
-  required_providers {{
-    aws = {{
-      source  = "hashicorp/aws"
-      version = "~> 5.0"
-    }}
-  }}
-}}
-
-provider "aws" {{
-  region = var.aws_region
-}}
-
-variable "aws_region" {{
-  description = "AWS region for resources"
-  type        = string
-  default     = "us-east-1"
-}}
-
-variable "environment" {{
-  description = "Environment name"
-  type        = string
-  default     = "dev"
-}}
-
-# Core infrastructure components
-{self._generate_terraform_resources(services)}
-
-output "infrastructure_info" {{
-  description = "Infrastructure deployment information"
-  value = {{
-    region      = var.aws_region
-    environment = var.environment
-    services    = {list(services.keys())}
-  }}
-}}
-"""
+        return _TERRAFORM_TEMPLATE.format_map(
+            {
+                "pattern_name": plan.get("pattern_name", "MLOps System"),
+                "resources": self._generate_terraform_resources(services),
+                "services": list(services.keys()),
+            }
+        )
 
     def _generate_terraform_resources(self, services: Dict[str, str]) -> str:
         """Generate Terraform resources based on services."""
         resources = []
 
-        if "lambda" in services or "serverless" in str(services).lower():
-            resources.append("""
-# Lambda function for serverless compute
-resource "aws_lambda_function" "mlops_function" {
-  filename         = "function.zip"
-  function_name    = "mlops-${var.environment}-function"
-  role            = aws_iam_role.lambda_role.arn
-  handler         = "main.handler"
-  runtime         = "python3.11"
-  timeout         = 300
-
-  tags = {
-    Environment = var.environment
-    Purpose     = "MLOps"
-  }
-}
-
-resource "aws_iam_role" "lambda_role" {
-  name = "mlops-${var.environment}-lambda-role"
-  assume_role_policy = jsonencode({
-    Version = "2012-10-17"
-    Statement = [
-      {
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {
-          Service = "lambda.amazonaws.com"
-        }
-      }
-    ]
-  })
-}""")
+        if "lambda" in services or _mentions_serverless(services):
+            resources.append(_TF_LAMBDA_RESOURCES)
 
         if "s3" in services:
-            resources.append("""
-# S3 bucket for data storage
-resource "aws_s3_bucket" "mlops_data" {
-  bucket = "mlops-${var.environment}-data-${random_id.bucket_suffix.hex}"
-  
-  tags = {
-    Environment = var.environment
-    Purpose     = "MLOps Data"
-  }
-}
-
-resource "random_id" "bucket_suffix" {
-  byte_length = 4
-}""")
+            resources.append(_TF_S3_RESOURCES)
 
         return "\n".join(resources)
 
     def _generate_application_template(self, plan: Dict[str, Any]) -> str:
         """Generate basic application template."""
-        return f'''"""
-MLOps Application - {plan.get("pattern_name", "MLOps System")}
-Generated by Agentic MLOps Platform
-"""
-
-import logging
-import os
-from datetime import datetime
-from typing import Dict, Any
-
-# Configure logging
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s %(levelname)s %(name)s %(message)s"
-)
-logger = logging.getLogger(__name__)
-
-
-class MLOpsApplication:
-    """Main MLOps application class."""
-    
-    def __init__(self):
-        self.config = self.load_config()
-        logger.info("MLOps application initialized")
-    
-    def load_config(self) -> Dict[str, Any]:
-        """Load application configuration."""
-        return {{
-            "environment": os.getenv("ENVIRONMENT", "dev"),
-            "aws_region": os.getenv("AWS_REGION", "us-east-1"),
-            "services": {list(plan.get("key_services", {}).keys())},
-            "initialized_at": datetime.utcnow().isoformat()
-        }}
-    
-    def run(self):
-        """Run the main application logic."""
-        logger.info("Starting MLOps application")
-        
-        # Application logic here
-        logger.info("MLOps application running successfully")
-
-
-def handler(event, context):
-    """Lambda handler function."""
-    app = MLOpsApplication()
-    app.run()
-    
-    return {{
-        "statusCode": 200,
-        "body": "MLOps application executed successfully"
-    }}
-
-
-if __name__ == "__main__":
-    app = MLOpsApplication()
-    app.run()
-'''
+        return _APP_TEMPLATE.format_map(
+            {
+                "pattern_name": plan.get("pattern_name", "MLOps System"),
+                "services": list(plan.get("key_services", {}).keys()),
+            }
+        )
 
     def _generate_ci_template(self, plan: Dict[str, Any]) -> str:
         """Generate CI/CD template."""
-        return f"""# MLOps CI/CD Pipeline - {plan.get("pattern_name", "MLOps System")}
-# Generated by Agentic MLOps Platform
-
-name: MLOps CI/CD
-
-on:
-  push:
-    branches: [ main, develop ]
-  pull_request:
-    branches: [ main ]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    
-    steps:
-    - uses: actions/checkout@v4
-    
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.11'
-    
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install -r requirements.txt
-        pip install pytest ruff
-    
-    - name: Lint with ruff
-      run: |
-        ruff check .
-        ruff format --check .
-    
-    - name: Test with pytest
-      run: |
-        pytest -v
-    
-    - name: Terraform validate
-      uses: hashicorp/setup-terraform@v2
-      with:
-        terraform_version: 1.5.0
-    
-    - name: Terraform format check
-      run: |
-        cd terraform
-        terraform fmt -check
-        terraform init
-        terraform validate
-
-  deploy:
-    needs: test
-    runs-on: ubuntu-latest
-    if: github.ref == 'refs/heads/main'
-    
-    steps:
-    - uses: actions/checkout@v4
-    
-    - name: Configure AWS credentials
-      uses: aws-actions/configure-aws-credentials@v2
-      with:
-        aws-access-key-id: ${{{{ secrets.AWS_ACCESS_KEY_ID }}}}
-        aws-secret-access-key: ${{{{ secrets.AWS_SECRET_ACCESS_KEY }}}}
-        aws-region: us-east-1
-    
-    - name: Deploy infrastructure
-      run: |
-        cd terraform
-        terraform init
-        terraform plan
-        terraform apply -auto-approve
-    
-    - name: Deploy application
-      run: |
-        # Application deployment logic here
-        echo "Deploying MLOps application..."
-"""
+        return _CI_TEMPLATE.format_map(
+            {"pattern_name": plan.get("pattern_name", "MLOps System")}
+        )
 
 
 class CodegenError(Exception):
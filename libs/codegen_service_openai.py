@@ -7,8 +7,10 @@ using OpenAI API when Claude/Anthropic API is not available.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
+import re
 import tempfile
 import shutil
 import zipfile
@@ -16,13 +18,43 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from libs.codegen_common import (
+    TRANSFER_CONFIG,
+    classify_path,
+    get_s3_client,
+    iter_files,
+)
 from libs.llm_client import get_llm_client, OpenAIClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on remembered component responses when CODEGEN_PLAN_CACHE=1
+_COMPONENT_CACHE_MAX_ENTRIES = 256
+
+
+def _component_cache_key(component_name: str, prompt: str) -> str:
+    """Return a stable key for one component request."""
+    payload = f"{component_name}\0{prompt}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# A markdown fence line (``` with optional language tag) and a blank line.
+# Matching whole lines keeps _clean_code_blocks' line semantics: fences are
+# dropped, and blank lines are dropped only between an opening and closing
+# fence. A trailing blank line without a newline is left to the final strip().
+_FENCE_LINE_RE = re.compile(r"^[^\S\n]*```[^\n]*(?:\n|\Z)", re.MULTILINE)
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]*\n", re.MULTILINE)
+
+# Shared by every component request, so all of them start with the same
+# system message and any provider-side prompt prefix cache can match it
+_SYSTEM_PROMPT = (
+    "You are an expert MLOps engineer. Generate production-ready code following best practices. "
+    "Return ONLY the file content without any markdown formatting or explanations. "
+    "When generating multiple files, separate them with '--- FILE: filename ---' markers."
+)
+
 
 class OpenAICodegenService:
     """Service for generating MLOps code artifacts using OpenAI API."""
@@ -31,10 +63,17 @@ class OpenAICodegenService:
         self.s3_client = None
         self.s3_bucket = os.getenv("S3_BUCKET_NAME")
         self.llm_client: Optional[OpenAIClient] = None
+        self._openai_max_concurrency = int(os.getenv("OPENAI_MAX_CONCURRENCY", "4"))
+        # Opt-in reuse of responses for identical component prompts
+        self._component_cache_enabled = os.getenv("CODEGEN_PLAN_CACHE", "0") == "1"
+        self._component_cache: Dict[str, str] = {}
+        # Deflate level for repository ZIPs. The default of 1 is much faster
+        # than zlib's 6 on generated source for a few percent larger archives
+        self._zip_level = int(os.getenv("CODEGEN_ZIP_LEVEL", "1"))
 
         if self.s3_bucket:
             try:
-                self.s3_client = boto3.client("s3")
+                self.s3_client = get_s3_client()
             except Exception as e:
                 logger.warning(f"Failed to initialize S3 client: {e}")
 
@@ -62,29 +101,40 @@ class OpenAICodegenService:
             },
         )
 
+        # One timestamp for the result and all of its artifacts
+        generated_at = datetime.now(timezone.utc).isoformat()
+
         try:
             # Create temporary directory for generated code
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
 
                 # Generate code using OpenAI
-                artifacts = await self._generate_code_with_openai(plan, temp_path)
+                artifacts = await self._generate_code_with_openai(
+                    plan, temp_path, now_iso=generated_at
+                )
 
                 # Create reports directory
                 reports_dir = temp_path / "reports"
                 reports_dir.mkdir(exist_ok=True)
 
-                # Create repository ZIP
-                zip_path = temp_path / "mlops_repository.zip"
-                zip_key = await self._create_repository_zip(temp_path, zip_path, plan)
+                # Create repository ZIP directly in the artifacts directory so
+                # persisting it is a rename rather than a second full copy
+                zip_path = self._artifacts_dir() / f".{temp_path.name}.zip.partial"
+                try:
+                    zip_key = await self._create_repository_zip(
+                        temp_path, zip_path, plan
+                    )
 
-                # Persist ZIP locally for download
-                persisted_zip = self._persist_zip(zip_path, zip_key)
+                    # Persist ZIP locally for download
+                    persisted_zip = self._persist_zip(zip_path, zip_key)
+                finally:
+                    zip_path.unlink(missing_ok=True)
 
                 # Upload to S3 if available
                 s3_url = None
                 if self.s3_client and self.s3_bucket:
-                    s3_url = await self._upload_to_s3(zip_path, zip_key)
+                    s3_url = await self._upload_to_s3(persisted_zip, zip_key)
 
                 return {
                     "artifacts": artifacts,
@@ -96,7 +146,7 @@ class OpenAICodegenService:
                         if persisted_zip.exists()
                         else 0,
                     },
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "generated_at": generated_at,
                     "plan_used": plan.get("pattern_name", "unknown"),
                     "generator": "openai",
                 }
@@ -105,24 +155,30 @@ class OpenAICodegenService:
             logger.exception("Failed to generate MLOps repository with OpenAI")
             raise CodegenError(f"Repository generation failed: {str(e)}")
 
-    def _persist_zip(self, zip_path: Path, zip_key: str) -> Path:
+    def _artifacts_dir(self) -> Path:
         artifacts_dir = Path(
             os.getenv("ARTIFACTS_DIR", "./artifacts")
         ).resolve()
         artifacts_dir.mkdir(parents=True, exist_ok=True)
-        target_path = artifacts_dir / zip_key
-        shutil.copyfile(zip_path, target_path)
+        return artifacts_dir
+
+    def _persist_zip(self, zip_path: Path, zip_key: str) -> Path:
+        target_path = self._artifacts_dir() / zip_key
+        # A rename when zip_path is already on the artifacts filesystem
+        shutil.move(zip_path, target_path)
         return target_path
 
     async def _generate_code_with_openai(
-        self, plan: Dict[str, Any], output_dir: Path
+        self, plan: Dict[str, Any], output_dir: Path, now_iso: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Generate code files using OpenAI API."""
         logger.info("Generating code with OpenAI API")
 
         try:
             # Generate components separately for better quality
-            artifacts = await self._generate_decomposed_components(plan, output_dir)
+            artifacts = await self._generate_decomposed_components(
+                plan, output_dir, now_iso=now_iso
+            )
             logger.info(
                 f"Generated {len(artifacts)} code artifacts using OpenAI decomposed approach"
             )
@@ -133,7 +189,7 @@ class OpenAICodegenService:
             raise CodegenError(f"OpenAI generation failed: {str(e)}")
 
     async def _generate_decomposed_components(
-        self, plan: Dict[str, Any], output_dir: Path
+        self, plan: Dict[str, Any], output_dir: Path, now_iso: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Generate MLOps components using multiple focused OpenAI calls."""
         artifacts = []
@@ -157,6 +213,8 @@ class OpenAICodegenService:
                 "subdir": ".github/workflows",
                 "prompt_builder": self._create_cicd_prompt,
                 "file_patterns": ["*.yml", "*.yaml"],
+                # A single workflow file; caps runaway generations early
+                "max_tokens": 2000,
             },
             {
                 "name": "documentation",
@@ -166,27 +224,45 @@ class OpenAICodegenService:
             },
         ]
 
-        for component in components:
-            try:
+        # The code components write to disjoint subdirectories, so they run
+        # concurrently. Documentation writes to the repository root, and the
+        # filenames in its response could land inside those subdirectories,
+        # so it runs once they are done. The semaphore is per call so it is
+        # always bound to the running loop.
+        *code_components, documentation = components
+        semaphore = asyncio.Semaphore(self._openai_max_concurrency)
+
+        async def generate(component: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
                 logger.info(f"Generating {component['name']} component with OpenAI")
-                component_artifacts = await self._generate_single_component(
-                    plan, output_dir, component
-                )
-                artifacts.extend(component_artifacts)
-                logger.info(
-                    f"Generated {len(component_artifacts)} files for {component['name']}"
+                return await self._generate_single_component(
+                    plan, output_dir, component, now_iso=now_iso
                 )
 
-            except Exception as e:
+        results = await asyncio.gather(
+            *(generate(component) for component in code_components),
+            return_exceptions=True,
+        )
+        results += await asyncio.gather(generate(documentation), return_exceptions=True)
+
+        for component, result in zip(components, results):
+            if isinstance(result, BaseException):
                 logger.warning(
-                    f"Failed to generate {component['name']} component: {e}"
+                    f"Failed to generate {component['name']} component: {result}"
                 )
                 # Continue with other components
+                continue
+            artifacts.extend(result)
+            logger.info(f"Generated {len(result)} files for {component['name']}")
 
         return artifacts
 
     async def _generate_single_component(
-        self, plan: Dict[str, Any], output_dir: Path, component: Dict[str, Any]
+        self,
+        plan: Dict[str, Any],
+        output_dir: Path,
+        component: Dict[str, Any],
+        now_iso: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Generate a single MLOps component using OpenAI."""
         target_dir = output_dir / component["subdir"]
@@ -195,32 +271,54 @@ class OpenAICodegenService:
         # Create generation prompt
         prompt = component["prompt_builder"](plan)
 
-        # Get LLM client
-        client = self._get_llm_client()
+        cache_key = None
+        response = None
+        if self._component_cache_enabled:
+            cache_key = _component_cache_key(component["name"], prompt)
+            response = self._component_cache.get(cache_key)
 
-        # Generate code with OpenAI
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert MLOps engineer. Generate production-ready code following best practices. "
-                "Return ONLY the file content without any markdown formatting or explanations. "
-                "When generating multiple files, separate them with '--- FILE: filename ---' markers.",
-            },
-            {"role": "user", "content": prompt},
-        ]
+        if response is None:
+            # Get LLM client
+            client = self._get_llm_client()
 
-        response = await client.complete(messages=messages, max_tokens=4000)
+            # Generate code with OpenAI
+            messages = [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ]
 
-        # Parse response and create files
-        artifacts = self._parse_and_write_files(response, target_dir, output_dir)
+            response = await client.complete(
+                messages=messages, max_tokens=component.get("max_tokens", 4000)
+            )
+            if cache_key is not None:
+                self._remember_response(cache_key, response)
+        else:
+            logger.info(f"Reusing cached {component['name']} component response")
+
+        # Parse response and create files in one worker-thread hop so the
+        # writes do not block other components' requests
+        artifacts = await asyncio.to_thread(
+            self._parse_and_write_files, response, target_dir, output_dir, now_iso
+        )
 
         return artifacts
 
+    def _remember_response(self, cache_key: str, response: str) -> None:
+        if len(self._component_cache) >= _COMPONENT_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._component_cache.pop(next(iter(self._component_cache)))
+        self._component_cache[cache_key] = response
+
     def _parse_and_write_files(
-        self, response: str, target_dir: Path, output_dir: Path
+        self,
+        response: str,
+        target_dir: Path,
+        output_dir: Path,
+        now_iso: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Parse OpenAI response and write files to disk."""
         artifacts = []
+        now_iso = now_iso or datetime.now(timezone.utc).isoformat()
 
         # Check if response contains file markers
         if "--- FILE:" in response:
@@ -238,10 +336,11 @@ class OpenAICodegenService:
                 # Clean markdown code blocks if present
                 content = self._clean_code_blocks(content)
 
-                # Write file
+                # Write file; the encoded length is its size on disk
                 file_path = target_dir / filename
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(content)
+                data = content.encode("utf-8")
+                file_path.write_bytes(data)
 
                 # Create artifact entry
                 relative_path = file_path.relative_to(output_dir)
@@ -249,8 +348,8 @@ class OpenAICodegenService:
                     {
                         "path": str(relative_path),
                         "kind": self._classify_file_kind(str(relative_path)),
-                        "size_bytes": file_path.stat().st_size,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "size_bytes": len(data),
+                        "created_at": now_iso,
                     }
                 )
 
@@ -262,15 +361,16 @@ class OpenAICodegenService:
             filename = self._determine_filename_from_content(content, target_dir)
 
             file_path = target_dir / filename
-            file_path.write_text(content)
+            data = content.encode("utf-8")
+            file_path.write_bytes(data)
 
             relative_path = file_path.relative_to(output_dir)
             artifacts.append(
                 {
                     "path": str(relative_path),
                     "kind": self._classify_file_kind(str(relative_path)),
-                    "size_bytes": file_path.stat().st_size,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "size_bytes": len(data),
+                    "created_at": now_iso,
                 }
             )
 
@@ -278,18 +378,10 @@ class OpenAICodegenService:
 
     def _clean_code_blocks(self, content: str) -> str:
         """Remove markdown code blocks from content."""
-        lines = content.split("\n")
-        cleaned_lines = []
-        in_code_block = False
-
-        for line in lines:
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if not in_code_block or line.strip():
-                cleaned_lines.append(line)
-
-        return "\n".join(cleaned_lines).strip()
+        # Splitting on fence lines alternates outside / inside-fence segments
+        parts = _FENCE_LINE_RE.split(content)
+        parts[1::2] = [_BLANK_LINE_RE.sub("", part) for part in parts[1::2]]
+        return "".join(parts).strip()
 
     def _determine_filename_from_content(
         self, content: str, target_dir: Path
@@ -459,36 +551,31 @@ Requirements:
 
     def _classify_file_kind(self, file_path: str) -> str:
         """Classify the type of generated file."""
-        path_lower = file_path.lower()
-
-        if "terraform" in path_lower or file_path.endswith(".tf"):
-            return "infrastructure"
-        elif any(ext in path_lower for ext in [".py", ".js", ".go", ".java"]):
-            return "application"
-        elif ".github" in path_lower or "ci" in path_lower:
-            return "ci_cd"
-        elif any(name in path_lower for name in ["readme", "doc", ".md"]):
-            return "documentation"
-        elif any(
-            name in path_lower for name in ["config", ".env", ".yaml", ".json"]
-        ):
-            return "configuration"
-        else:
-            return "other"
+        return classify_path(file_path)
 
     async def _create_repository_zip(
         self, source_dir: Path, zip_path: Path, plan: Dict[str, Any]
+    ) -> str:
+        """Create a ZIP archive of the generated repository in a worker thread."""
+        return await asyncio.to_thread(
+            self._create_repository_zip_sync, source_dir, zip_path, plan
+        )
+
+    def _create_repository_zip_sync(
+        self, source_dir: Path, zip_path: Path, plan: Dict[str, Any]
     ) -> str:
         """Create a ZIP archive of the generated repository."""
         pattern_name = plan.get("pattern_name", "mlops-project")
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         zip_key = f"{pattern_name.lower().replace(' ', '-')}_{timestamp}.zip"
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob("*"):
-                if file_path.is_file() and file_path != zip_path:
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+        with zipfile.ZipFile(
+            zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=self._zip_level
+        ) as zipf:
+            zip_name = str(zip_path)
+            for entry in iter_files(str(source_dir)):
+                if entry.path != zip_name:
+                    zipf.write(entry.path, os.path.relpath(entry.path, source_dir))
 
         logger.info(f"Created repository ZIP: {zip_key}")
         return zip_key
@@ -496,11 +583,14 @@ Requirements:
     async def _upload_to_s3(self, zip_path: Path, zip_key: str) -> Optional[str]:
         """Upload the repository ZIP to S3."""
         try:
-            self.s3_client.upload_file(
+            # upload_file blocks; run it off the event loop
+            await asyncio.to_thread(
+                self.s3_client.upload_file,
                 str(zip_path),
                 self.s3_bucket,
                 f"artifacts/{zip_key}",
                 ExtraArgs={"ContentType": "application/zip"},
+                Config=TRANSFER_CONFIG,
             )
 
             s3_url = f"s3://{self.s3_bucket}/artifacts/{zip_key}"
@@ -7,12 +7,20 @@ Used for structured data flow between agents and validation.
 
 from __future__ import annotations
 
-from typing import List, Optional, Literal
+from typing import Any, Callable, List, Optional, Literal, Tuple
 from enum import Enum
+from functools import lru_cache
 from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime
 
 
+# Shared Literal types for the string-valued choice fields below
+ModelSizeCategory = Literal["small", "medium", "large", "very_large"]
+TrainingFrequency = Literal["one_time", "weekly", "daily", "real_time"]
+QuestionPriority = Literal["high", "medium", "low"]
+QuestionType = Literal["choice", "numeric", "text", "boolean"]
+
+
 class BudgetBand(str, Enum):
     """Budget bands for organizational sizing."""
 
@@ -60,6 +68,95 @@ class WorkloadType(str, Enum):
     BATCH_INFERENCE = "batch_inference"
 
 
+# AWS region name prefixes accepted by MLOpsConstraints.regions, plus the
+# non-region values allowed there
+_VALID_REGION_PREFIXES = ("us-", "eu-", "ap-", "sa-", "ca-", "af-", "me-")
+_SPECIAL_REGIONS = frozenset({"global", "multi-region"})
+
+
+# Fields reported by MLOpsConstraints.get_missing_critical_fields
+_CRITICAL_FIELD_NAMES = ("project_description", "budget_band", "workload_types")
+
+
+def _has_items(value: Any) -> bool:
+    return value is not None and len(value) > 0
+
+
+def _has_text(value: Any) -> bool:
+    # Also covers the str-based enums, which are never blank
+    return value is not None and bool(value.strip())
+
+
+def _is_set(value: Any) -> bool:
+    return value is not None
+
+
+# Coverage weight of each constraint field, in scoring order, with the check
+# that decides whether the field counts as filled
+_FIELD_WEIGHTS: Tuple[Tuple[str, float, Callable[[Any], bool]], ...] = (
+    # Critical fields (high weight)
+    ("project_description", 3.0, _has_text),
+    ("budget_band", 2.0, _has_text),
+    ("workload_types", 2.0, _has_items),
+    ("data_classification", 2.0, _has_text),
+    # Important fields (medium weight)
+    ("deployment_preference", 1.5, _has_text),
+    ("expected_throughput", 1.5, _has_text),
+    ("regions", 1.0, _has_items),
+    # Optional fields (low weight)
+    ("latency_requirements_ms", 1.0, _is_set),
+    ("availability_target", 1.0, _is_set),
+    ("team_expertise", 0.5, _has_items),
+    ("model_types", 0.5, _has_items),
+)
+_TOTAL_FIELD_WEIGHT = sum(weight for _, weight, _ in _FIELD_WEIGHTS)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _render_context_string(
+    project_description: str,
+    budget_band: BudgetBand,
+    deployment_preference: DeploymentPreference,
+    workload_types: Tuple[WorkloadType, ...],
+    expected_throughput: ThroughputLevel,
+    data_classification: DataClassification,
+    regions: Tuple[str, ...],
+    latency_requirements_ms: Optional[int],
+    availability_target: Optional[float],
+    compliance_requirements: Tuple[str, ...],
+    team_expertise: Tuple[str, ...],
+) -> str:
+    """Render MLOpsConstraints.to_context_string for the given field values."""
+    # Optional lines carry their own leading newline so absent ones vanish
+    latency = (
+        f"\nLatency requirement: {latency_requirements_ms}ms"
+        if latency_requirements_ms
+        else ""
+    )
+    availability = (
+        f"\nAvailability target: {availability_target}%" if availability_target else ""
+    )
+    compliance = (
+        f"\nCompliance: {', '.join(compliance_requirements)}"
+        if compliance_requirements
+        else ""
+    )
+    expertise = (
+        f"\nTeam expertise: {', '.join(team_expertise)}" if team_expertise else ""
+    )
+
+    return (
+        f"Project: {project_description}\n"
+        f"Budget: {budget_band.value} category\n"
+        f"Deployment preference: {deployment_preference.value}\n"
+        f"Workloads: {', '.join(wt.value for wt in workload_types)}\n"
+        f"Expected throughput: {expected_throughput.value}\n"
+        f"Data classification: {data_classification.value}\n"
+        f"Regions: {', '.join(regions)}"
+        f"{latency}{availability}{compliance}{expertise}"
+    )
+
+
 class MLOpsConstraints(BaseModel):
     """
     Comprehensive constraint schema for MLOps project requirements.
@@ -129,12 +226,12 @@ class MLOpsConstraints(BaseModel):
         default_factory=list,
         description="Types of ML models (regression, classification, NLP, etc.)",
     )
-    model_size_category: Optional[Literal["small", "medium", "large", "very_large"]] = (
-        Field(None, description="Expected model size category")
+    model_size_category: Optional[ModelSizeCategory] = Field(
+        None, description="Expected model size category"
+    )
+    training_frequency: Optional[TrainingFrequency] = Field(
+        None, description="How often models need to be retrained"
     )
-    training_frequency: Optional[
-        Literal["one_time", "weekly", "daily", "real_time"]
-    ] = Field(None, description="How often models need to be retrained")
 
     # Integration requirements
     integration_requirements: List[str] = Field(
@@ -189,11 +286,10 @@ class MLOpsConstraints(BaseModel):
     @classmethod
     def validate_regions(cls, v):
         """Validate AWS region format."""
-        valid_prefixes = ["us-", "eu-", "ap-", "sa-", "ca-", "af-", "me-"]
         for region in v:
-            if not any(region.startswith(prefix) for prefix in valid_prefixes):
+            if not region.startswith(_VALID_REGION_PREFIXES):
                 # Allow 'global' and other special cases
-                if region not in ["global", "multi-region"]:
+                if region not in _SPECIAL_REGIONS:
                     raise ValueError(f"Invalid AWS region format: {region}")
         return v
 
@@ -235,93 +331,40 @@ class MLOpsConstraints(BaseModel):
         Returns:
             Coverage score based on filled fields and importance weights
         """
-        total_weight = 0.0
         filled_weight = 0.0
 
-        # Critical fields (high weight)
-        critical_fields = {
-            "project_description": 3.0,
-            "budget_band": 2.0,
-            "workload_types": 2.0,
-            "data_classification": 2.0,
-        }
-
-        # Important fields (medium weight)
-        important_fields = {
-            "deployment_preference": 1.5,
-            "expected_throughput": 1.5,
-            "regions": 1.0,
-        }
-
-        # Optional fields (low weight)
-        optional_fields = {
-            "latency_requirements_ms": 1.0,
-            "availability_target": 1.0,
-            "team_expertise": 0.5,
-            "model_types": 0.5,
-        }
-
-        all_fields = {**critical_fields, **important_fields, **optional_fields}
-
-        for field, weight in all_fields.items():
-            total_weight += weight
-            value = getattr(self, field, None)
-
-            if value is not None:
-                if isinstance(value, list) and len(value) > 0:
-                    filled_weight += weight
-                elif isinstance(value, str) and value.strip():
-                    filled_weight += weight
-                elif not isinstance(value, (list, str)):
-                    filled_weight += weight
-
-        return min(1.0, filled_weight / total_weight) if total_weight > 0 else 0.0
+        for field, weight, is_filled in _FIELD_WEIGHTS:
+            if is_filled(getattr(self, field, None)):
+                filled_weight += weight
+
+        return min(1.0, filled_weight / _TOTAL_FIELD_WEIGHT)
 
     def get_missing_critical_fields(self) -> List[str]:
         """Get list of missing critical fields."""
-        critical_fields = ["project_description", "budget_band", "workload_types"]
-        missing = []
-
-        for field in critical_fields:
-            value = getattr(self, field, None)
-            if value is None or (isinstance(value, str) and not value.strip()):
-                missing.append(field)
-
-        return missing
+        return [
+            field
+            for field in _CRITICAL_FIELD_NAMES
+            if (value := getattr(self, field, None)) is None
+            or (isinstance(value, str) and not value.strip())
+        ]
 
     def to_context_string(self) -> str:
         """Convert constraints to human-readable context string for LLM consumption."""
-        context_parts = []
-
-        context_parts.append(f"Project: {self.project_description}")
-        context_parts.append(f"Budget: {self.budget_band.value} category")
-        context_parts.append(
-            f"Deployment preference: {self.deployment_preference.value}"
+        # Rendered once per distinct set of values; lists are passed as tuples
+        # so in-place edits produce a new cache key
+        return _render_context_string(
+            self.project_description,
+            self.budget_band,
+            self.deployment_preference,
+            tuple(self.workload_types),
+            self.expected_throughput,
+            self.data_classification,
+            tuple(self.regions),
+            self.latency_requirements_ms,
+            self.availability_target,
+            tuple(self.compliance_requirements),
+            tuple(self.team_expertise),
         )
-        context_parts.append(
-            f"Workloads: {', '.join([wt.value for wt in self.workload_types])}"
-        )
-        context_parts.append(f"Expected throughput: {self.expected_throughput.value}")
-        context_parts.append(f"Data classification: {self.data_classification.value}")
-        context_parts.append(f"Regions: {', '.join(self.regions)}")
-
-        if self.latency_requirements_ms:
-            context_parts.append(
-                f"Latency requirement: {self.latency_requirements_ms}ms"
-            )
-
-        if self.availability_target:
-            context_parts.append(f"Availability target: {self.availability_target}%")
-
-        if self.compliance_requirements:
-            context_parts.append(
-                f"Compliance: {', '.join(self.compliance_requirements)}"
-            )
-
-        if self.team_expertise:
-            context_parts.append(f"Team expertise: {', '.join(self.team_expertise)}")
-
-        return "\n".join(context_parts)
 
 
 class ConstraintExtractionResult(BaseModel):
@@ -371,12 +414,8 @@ class AdaptiveQuestion(BaseModel):
     field_targets: List[str] = Field(
         description="Constraint fields this question aims to fill"
     )
-    priority: Literal["high", "medium", "low"] = Field(
-        description="Priority level of this question"
-    )
-    question_type: Literal["choice", "numeric", "text", "boolean"] = Field(
-        description="Type of expected answer"
-    )
+    priority: QuestionPriority = Field(description="Priority level of this question")
+    question_type: QuestionType = Field(description="Type of expected answer")
     choices: Optional[List[str]] = Field(
         None, description="Predefined choices for choice-type questions"
     )
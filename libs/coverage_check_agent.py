@@ -16,6 +16,30 @@ from .constraint_schema import CoverageAnalysisResult
 
 logger = logging.getLogger(__name__)
 
+# Longest slice of the user's original input quoted in the analysis prompt
+_USER_INPUT_PREVIEW_CHARS = 500
+
+# Fixed closing section of every coverage analysis prompt
+_ANALYSIS_REQUEST = "\n".join(
+    [
+        "",
+        "## Analysis Request",
+        "",
+        "Please perform a comprehensive coverage analysis focusing on:",
+        "",
+        "1. **Coverage Score Calculation**: Evaluate completeness across critical, important, and valuable constraint dimensions",
+        "2. **Critical Gap Identification**: Which missing fields would lead to poor architecture decisions?",
+        "3. **Optional Gap Assessment**: Which additional details would improve recommendation quality?",
+        "4. **Ambiguity Resolution**: Which fields need clarification to reduce risk?",
+        "5. **Threshold Assessment**: Is there sufficient information to proceed with planning (typically 70%+ coverage)?",
+        "6. **Improvement Recommendations**: Specific suggestions for addressing the most important gaps",
+        "",
+        "Consider both the explicit constraints and any implicit requirements suggested by the user's domain, use case, and stated preferences.",
+        "",
+        "Focus on practical completeness that enables sound architecture decisions rather than exhaustive documentation.",
+    ]
+)
+
 
 class CoverageCheckAgent(BaseLLMAgent):
     """
@@ -134,7 +158,6 @@ Focus on practical completeness rather than theoretical perfection. The goal is
 
         # Get extraction metadata
         extraction_info = context.state.get("constraint_extraction", {})
-        context.get_previous_agent_outputs()
 
         # Build detailed analysis prompt
         constraints_summary = context.constraints.to_context_string()
@@ -158,27 +181,12 @@ Focus on practical completeness rather than theoretical perfection. The goal is
                 ]
             )
 
+        user_input = context.user_input
+        if len(user_input) > _USER_INPUT_PREVIEW_CHARS:
+            user_input = user_input[:_USER_INPUT_PREVIEW_CHARS] + "..."
+
         prompt_parts.extend(
-            [
-                "",
-                "## Original User Input",
-                f'"{context.user_input[:500]}{"..." if len(context.user_input) > 500 else ""}"',
-                "",
-                "## Analysis Request",
-                "",
-                "Please perform a comprehensive coverage analysis focusing on:",
-                "",
-                "1. **Coverage Score Calculation**: Evaluate completeness across critical, important, and valuable constraint dimensions",
-                "2. **Critical Gap Identification**: Which missing fields would lead to poor architecture decisions?",
-                "3. **Optional Gap Assessment**: Which additional details would improve recommendation quality?",
-                "4. **Ambiguity Resolution**: Which fields need clarification to reduce risk?",
-                "5. **Threshold Assessment**: Is there sufficient information to proceed with planning (typically 70%+ coverage)?",
-                "6. **Improvement Recommendations**: Specific suggestions for addressing the most important gaps",
-                "",
-                "Consider both the explicit constraints and any implicit requirements suggested by the user's domain, use case, and stated preferences.",
-                "",
-                "Focus on practical completeness that enables sound architecture decisions rather than exhaustive documentation.",
-            ]
+            ["", "## Original User Input", f'"{user_input}"', _ANALYSIS_REQUEST]
         )
 
         return "\n".join(prompt_parts)
@@ -17,12 +17,18 @@ from .agent_framework import (
     BaseMLOpsAgent,
     AgentOutput,
     AgentType,
+    CandidateOption,
+    ImpactAssessment,
     TriggerType,
     MLOpsWorkflowState,
     ReasonCard,
 )
 from .llm_client import OpenAIClient, get_llm_client, LLMClientError
-from .constraint_schema import MLOpsConstraints
+from .constraint_schema import (
+    AdaptiveQuestion,
+    AdaptiveQuestioningResult,
+    MLOpsConstraints,
+)
 from pydantic import BaseModel
 
 # Type variable for structured outputs
@@ -31,6 +37,31 @@ T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 
+# Models touched by every agent execution, built ahead of the first request
+_PREWARM_MODELS = (
+    ReasonCard,
+    CandidateOption,
+    ImpactAssessment,
+    AgentOutput,
+    MLOpsConstraints,
+    AdaptiveQuestion,
+    AdaptiveQuestioningResult,
+)
+
+
+def prewarm_agent_validators() -> None:
+    """
+    Build pydantic-core validators for deferred agent models.
+
+    Deferred models compile their schema on first use, which would otherwise
+    land on the first LLM response of a fresh process. Call once at service
+    startup to pay that cost before any request arrives.
+    """
+    for model in _PREWARM_MODELS:
+        if not model.__pydantic_complete__:
+            model.model_rebuild(force=True)
+
+
 def is_mock_mode_enabled() -> bool:
     """Return True when MOCK_MODE feature flag is enabled."""
     flag = os.getenv("MOCK_MODE", "")
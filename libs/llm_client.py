@@ -108,6 +108,9 @@ class OpenAIClient:
         # Usage tracking
         self.usage_history: List[LLMUsageMetrics] = []
 
+        # Schema prompts rendered once per response model
+        self._schema_prompts: Dict[Type[BaseModel], str] = {}
+
     async def complete(
         self,
         messages: List[Dict[str, str]],
@@ -278,9 +281,13 @@ class OpenAIClient:
 
     def _build_schema_prompt(self, response_format: Type[BaseModel]) -> str:
         """Build JSON schema prompt for structured output."""
+        cached = self._schema_prompts.get(response_format)
+        if cached is not None:
+            return cached
+
         schema = response_format.model_json_schema()
 
-        return f"""
+        prompt = f"""
 IMPORTANT: You must respond with valid JSON that exactly matches this schema.
 Do not include any text before or after the JSON response.
 
@@ -290,6 +297,8 @@ Required JSON Schema:
 Example response format:
 {json.dumps(self._generate_example_response(response_format), indent=2)}
 """
+        self._schema_prompts[response_format] = prompt
+        return prompt
 
     def _generate_example_response(
         self, response_format: Type[BaseModel]
@@ -322,9 +322,13 @@ Be thorough but practical - focus on cost factors that meaningfully impact the b
             "estimated_monthly_cost": llm_response.estimated_monthly_cost,
             "cost_confidence": llm_response.cost_confidence,
             "cost_analysis_summary": llm_response.cost_analysis_summary,
-            "service_costs": llm_response.service_costs,
-            "infrastructure_costs": llm_response.infrastructure_costs,
-            "operational_costs": llm_response.operational_costs,
+            "service_costs": [item.model_dump() for item in llm_response.service_costs],
+            "infrastructure_costs": [
+                item.model_dump() for item in llm_response.infrastructure_costs
+            ],
+            "operational_costs": [
+                item.model_dump() for item in llm_response.operational_costs
+            ],
             "primary_cost_drivers": llm_response.primary_cost_drivers,
             "cost_distribution": llm_response.cost_distribution,
             "variable_vs_fixed": llm_response.variable_vs_fixed,
@@ -344,7 +348,9 @@ Be thorough but practical - focus on cost factors that meaningfully impact the b
             "value_propositions": llm_response.value_propositions,
             "cost_vs_benefit_analysis": llm_response.cost_vs_benefit_analysis,
             "cost_monitoring_strategy": llm_response.cost_monitoring_strategy,
-            "budget_alerts_recommended": llm_response.budget_alerts_recommended,
+            "budget_alerts_recommended": [
+                item.model_dump() for item in llm_response.budget_alerts_recommended
+            ],
             "cost_governance_needs": llm_response.cost_governance_needs,
             "cost_assumptions": llm_response.cost_assumptions,
             "pricing_methodology": llm_response.pricing_methodology,
@@ -364,7 +364,9 @@ Be thorough but practical - focus on policy requirements that meaningfully impac
             "overall_compliance_status": llm_response.overall_compliance_status,
             "compliance_score": llm_response.compliance_score,
             "policy_assessment_summary": llm_response.policy_assessment_summary,
-            "policy_rule_results": llm_response.policy_rule_results,
+            "policy_rule_results": [
+                item.model_dump() for item in llm_response.policy_rule_results
+            ],
             "critical_violations": llm_response.critical_violations,
             "warnings": llm_response.warnings,
             "security_compliance": llm_response.security_compliance,
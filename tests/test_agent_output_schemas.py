@@ -0,0 +1,127 @@
+"""
+Tests for agent output schema lookup and validation helpers
+"""
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from libs.agent_output_schemas import (
+    AGENT_OUTPUT_SCHEMAS,
+    PlannerOutput,
+    PolicyRuleResult,
+    ServiceCost,
+    register_agent_schema,
+    get_agent_output_schema,
+    rebuild_schema_cache,
+    validate_agent_output,
+    validate_agent_outputs,
+)
+
+
+@pytest.fixture
+def planner_output_data():
+    """Minimal valid planner output payload."""
+    return {
+        "selected_pattern_id": "serverless_inference_basic",
+        "pattern_name": "Serverless Inference Basic",
+        "selection_confidence": 0.8,
+        "selection_rationale": "Matches budget and deployment preferences",
+        "alternatives_considered": [
+            {"pattern_id": "batch_inference", "reason": "Not real-time"}
+        ],
+        "pattern_comparison": "Serverless is cheaper at low volume",
+        "architecture_overview": "Lambda behind API Gateway with S3 model store",
+        "key_services": {"inference": "AWS Lambda", "storage": "Amazon S3"},
+        "estimated_monthly_cost": 350.0,
+        "deployment_approach": "Canary releases",
+        "implementation_phases": ["Setup", "Deploy"],
+        "critical_success_factors": ["Low cold start latency"],
+        "potential_challenges": ["Cold starts"],
+        "success_metrics": ["p95 latency"],
+        "assumptions_made": ["Traffic is bursty"],
+        "decision_criteria": ["Cost"],
+    }
+
+
+class TestAgentOutputSchemas:
+    """Test schema lookup and validation."""
+
+    def test_get_agent_output_schema(self):
+        """Test schema lookup for known agent types."""
+        for agent_type, schema_class in AGENT_OUTPUT_SCHEMAS.items():
+            assert get_agent_output_schema(agent_type) is schema_class
+
+    def test_get_agent_output_schema_unknown(self):
+        """Test unknown agent types raise ValueError listing available types."""
+        with pytest.raises(ValueError, match="Available types: intake_extract"):
+            get_agent_output_schema("unknown_agent")
+
+    def test_register_agent_schema(self):
+        """Test decorator registration after a cache rebuild."""
+
+        @register_agent_schema("test_agent")
+        class TestAgentOutput(BaseModel):
+            summary: str
+
+        try:
+            rebuild_schema_cache()
+            assert get_agent_output_schema("test_agent") is TestAgentOutput
+            result = validate_agent_output("test_agent", {"summary": "ok"})
+            assert result.summary == "ok"
+        finally:
+            del AGENT_OUTPUT_SCHEMAS["test_agent"]
+            rebuild_schema_cache()
+
+        with pytest.raises(ValueError, match="Unknown agent type: test_agent"):
+            validate_agent_output("test_agent", {"summary": "ok"})
+
+    def test_validate_agent_output(self, planner_output_data):
+        """Test validation returns the agent's schema instance."""
+        result = validate_agent_output("planner", planner_output_data)
+
+        assert isinstance(result, PlannerOutput)
+        assert result.estimated_monthly_cost == 350.0
+
+    def test_validate_agent_output_invalid(self, planner_output_data):
+        """Test invalid payloads raise ValidationError."""
+        planner_output_data["selection_confidence"] = 1.5
+
+        with pytest.raises(ValidationError):
+            validate_agent_output("planner", planner_output_data)
+
+    def test_validate_agent_output_unknown_type(self, planner_output_data):
+        """Test unknown agent types raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown agent type: unknown_agent"):
+            validate_agent_output("unknown_agent", planner_output_data)
+
+    def test_validate_agent_outputs(self, planner_output_data):
+        """Test batch validation returns instances in input order."""
+        second = {**planner_output_data, "estimated_monthly_cost": 500.0}
+        results = validate_agent_outputs("planner", [planner_output_data, second])
+
+        assert [r.estimated_monthly_cost for r in results] == [350.0, 500.0]
+        assert all(isinstance(r, PlannerOutput) for r in results)
+
+        second["selection_confidence"] = 1.5
+        with pytest.raises(ValidationError):
+            validate_agent_outputs("planner", [planner_output_data, second])
+
+        with pytest.raises(ValueError, match="Unknown agent type: unknown_agent"):
+            validate_agent_outputs("unknown_agent", [])
+
+    def test_line_item_models(self):
+        """Test line items validate known keys and keep extra LLM keys."""
+        item = ServiceCost.model_validate(
+            {"service": "lambda", "cost": "50", "region": "us-east-1"}
+        )
+
+        assert item.cost == 50.0
+        assert item.model_dump() == {
+            "service": "lambda",
+            "cost": 50.0,
+            "description": "",
+            "region": "us-east-1",
+        }
+
+        with pytest.raises(ValidationError):
+            PolicyRuleResult.model_validate({"rule": "budget", "status": "unknown"})
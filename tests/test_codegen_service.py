@@ -1,5 +1,7 @@
 import asyncio
+import os
 import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 # Provide a stub Claude SDK so CodegenService can import without the real package
 import sys
@@ -36,7 +38,7 @@ _sdk_stub.ClaudeCodeOptions = _StubClaudeCodeOptions
 _sdk_stub.ClaudeSDKClient = _StubClaudeSDKClient
 sys.modules.setdefault("claude_code_sdk", _sdk_stub)
 
-from libs.codegen_service import CodegenService
+from libs.codegen_service import CodegenService, _PlanView, _plan_fingerprint
 
 
 @dataclass
@@ -103,3 +105,216 @@ def test_claude_codegen_stream_success(monkeypatch):
         artifact["path"] == "src/main.py" for artifact in result["artifacts"]
     ), "Claude artifacts should include generated file"
     assert result["repository_zip"].get("size_bytes", 0) >= 0
+
+
+def test_plan_fingerprint_is_canonical():
+    """Plans differing only in key order or unrelated fields share a fingerprint."""
+    plan = {
+        "pattern_name": "test-pattern",
+        "key_services": {"api": "FastAPI service", "storage": "S3"},
+        "estimated_monthly_cost": 100,
+    }
+    reordered = {
+        "estimated_monthly_cost": 100,
+        "key_services": {"storage": "S3", "api": "FastAPI service"},
+        "pattern_name": "test-pattern",
+        "selection_rationale": "not part of the generated code",
+    }
+
+    assert _plan_fingerprint(plan) == _plan_fingerprint(reordered)
+    assert _plan_fingerprint(plan) != _plan_fingerprint(
+        {**plan, "estimated_monthly_cost": 200}
+    )
+
+
+def _component(timeout: float = 5) -> dict:
+    return {
+        "name": "application",
+        "subdir": "src",
+        "system_prompt": "system",
+        "user_prompt": "user",
+        "timeout": timeout,
+    }
+
+
+def test_component_retry_discards_partial_output(tmp_path, monkeypatch):
+    """A transient failure is retried and the failed attempt's files are removed."""
+    attempts = []
+
+    class _FlakyClient(_MockClaudeClient):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+            attempts.append(self)
+
+        async def receive_response(self):
+            target_dir = tmp_path / "src"
+            if len(attempts) == 1:
+                (target_dir / "partial.py").write_text("# half written")
+                raise ConnectionError("connection reset")
+            (target_dir / "main.py").write_text("app = None")
+            yield _MockMessage(type="file_created", file_info={})
+
+    monkeypatch.setattr("libs.codegen_service.ClaudeSDKClient", _FlakyClient)
+
+    service = CodegenService()
+    artifacts = asyncio.run(
+        service._generate_single_component({}, tmp_path, _component())
+    )
+
+    assert len(attempts) == 2
+    assert [artifact["path"] for artifact in artifacts] == ["src/main.py"]
+    assert not (tmp_path / "src" / "partial.py").exists()
+
+
+def test_component_timeout_is_not_retried(tmp_path, monkeypatch):
+    """A component that times out fails at once instead of running again."""
+    attempts = []
+
+    class _SlowClient(_MockClaudeClient):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+            attempts.append(self)
+
+        async def receive_response(self):
+            (tmp_path / "src" / "partial.py").write_text("# half written")
+            await asyncio.sleep(10)
+            yield _MockMessage(type="file_created", file_info={})
+
+    monkeypatch.setattr("libs.codegen_service.ClaudeSDKClient", _SlowClient)
+
+    service = CodegenService()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service._generate_single_component({}, tmp_path, _component(0.05)))
+
+    assert len(attempts) == 1
+    assert not (tmp_path / "src" / "partial.py").exists()
+
+
+def _cached_service(tmp_path, monkeypatch, complete=True):
+    """CodegenService with the plan cache on and a counting generator stub."""
+    monkeypatch.delenv("S3_BUCKET_NAME", raising=False)
+    monkeypatch.setenv("ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("CODEGEN_PLAN_CACHE", "1")
+    calls = []
+
+    async def _generate(self, plan, output_dir, now_iso=None):
+        calls.append(plan)
+        (output_dir / "src").mkdir()
+        (output_dir / "src" / "main.py").write_text("app = None")
+        return [{"path": "src/main.py", "kind": "application"}], complete
+
+    monkeypatch.setattr(CodegenService, "_generate_code_with_claude", _generate)
+    return CodegenService(), calls
+
+
+_CACHE_PLAN = {"pattern_name": "cache-pattern", "estimated_monthly_cost": 100}
+
+
+def test_plan_cache_hit_reuses_repository(tmp_path, monkeypatch):
+    """A repeated plan is served from the cache while its ZIP still exists."""
+    service, calls = _cached_service(tmp_path, monkeypatch)
+
+    first = asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+    second = asyncio.run(service.generate_mlops_repository(dict(_CACHE_PLAN)))
+
+    assert len(calls) == 1
+    assert second == first
+
+
+def test_plan_cache_miss_when_zip_missing_or_expired(tmp_path, monkeypatch):
+    """Missing ZIPs and expired entries are regenerated instead of reused."""
+    service, calls = _cached_service(tmp_path, monkeypatch)
+
+    first = asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+    os.unlink(first["repository_zip"]["local_path"])
+    asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+    assert len(calls) == 2
+
+    fingerprint = _plan_fingerprint(_CACHE_PLAN)
+    service._plan_cache[fingerprint] = (0.0, service._plan_cache[fingerprint][1])
+    asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+    assert len(calls) == 3
+
+
+def test_plan_cache_skips_incomplete_generation(tmp_path, monkeypatch):
+    """A run with a failed component is not cached."""
+    service, calls = _cached_service(tmp_path, monkeypatch, complete=False)
+
+    asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+    asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+
+    assert len(calls) == 2
+    assert not service._plan_cache
+
+
+class _FailingS3Client:
+    """S3 stub whose manifest reads and/or writes fail with a botocore error."""
+
+    def __init__(self, fail_get=False, fail_put=False):
+        self.fail_get = fail_get
+        self.fail_put = fail_put
+        self.puts = []
+
+    def get_object(self, **kwargs):
+        if self.fail_get:
+            raise EndpointConnectionError(endpoint_url="https://s3.example")
+        raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+    def put_object(self, **kwargs):
+        if self.fail_put:
+            raise EndpointConnectionError(endpoint_url="https://s3.example")
+        self.puts.append(kwargs["Key"])
+
+    def upload_file(self, *args, **kwargs):
+        return None
+
+
+def test_plan_cache_manifest_read_error_is_a_miss(tmp_path, monkeypatch):
+    """A botocore error reading the manifest falls through to generation."""
+    service, calls = _cached_service(tmp_path, monkeypatch)
+    service.s3_client = _FailingS3Client(fail_get=True)
+    service.s3_bucket = "bucket"
+
+    result = asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+
+    assert len(calls) == 1
+    assert result["artifacts"]
+    assert service.s3_client.puts == [
+        f"artifacts/cache/{_plan_fingerprint(_CACHE_PLAN)}.json"
+    ]
+
+
+def test_plan_cache_manifest_write_error_keeps_result(tmp_path, monkeypatch):
+    """A botocore error storing the manifest does not fail the generation."""
+    service, calls = _cached_service(tmp_path, monkeypatch)
+    service.s3_client = _FailingS3Client(fail_put=True)
+    service.s3_bucket = "bucket"
+
+    result = asyncio.run(service.generate_mlops_repository(_CACHE_PLAN))
+
+    assert len(calls) == 1
+    assert result["repository_zip"]["s3_url"].startswith("s3://bucket/")
+    assert _plan_fingerprint(_CACHE_PLAN) in service._plan_cache
+
+
+def test_prompts_render_explicit_none_plan_fields():
+    """Defaults apply to absent plan fields only, as with plan.get(key, default)."""
+    service = CodegenService()
+
+    absent = _PlanView.from_plan({"key_services": {}})
+    explicit_none = _PlanView.from_plan(
+        {
+            "key_services": {},
+            "architecture_type": None,
+            "estimated_monthly_cost": None,
+        }
+    )
+
+    absent_prompt = service._create_infrastructure_prompt(absent)
+    assert "for app_runner architecture" in absent_prompt
+    assert "$100/month" in absent_prompt
+
+    none_prompt = service._create_infrastructure_prompt(explicit_none)
+    assert "for None architecture" in none_prompt
+    assert "$None/month" in none_prompt
+    assert "$None/month" in service._create_generation_prompt(explicit_none)
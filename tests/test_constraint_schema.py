@@ -206,6 +206,22 @@ class TestMLOpsConstraints:
         assert "PCI-DSS" in context
         assert "200ms" in context
 
+    def test_context_string_tracks_changes(self):
+        """Cached context strings follow later edits to the constraints."""
+        constraints = MLOpsConstraints(project_description="Churn model")
+        first = constraints.to_context_string()
+        assert constraints.to_context_string() == first
+
+        constraints.regions.append("eu-west-1")
+        constraints.latency_requirements_ms = 50
+
+        context = constraints.to_context_string()
+        assert "Regions: us-east-1, eu-west-1" in context
+        assert "Latency requirement: 50ms" in context
+        assert MLOpsConstraints(project_description="Churn model") == MLOpsConstraints(
+            project_description="Churn model"
+        )
+
 
 class TestConstraintExtractionResult:
     """Test constraint extraction result schema."""
@@ -11,9 +11,15 @@ Tests the complete LLM transformation including:
 
 import pytest
 import asyncio
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, AsyncMock
 
-from libs.agent_framework import AgentType, TriggerType, MLOpsWorkflowState
+from libs.agent_framework import (
+    AgentType,
+    MLOpsWorkflowState,
+    ReasonCard,
+    TriggerType,
+)
 from libs.constraint_schema import (
     MLOpsConstraints,
     ConstraintExtractionResult,
@@ -209,6 +215,34 @@ class TestCoverageCheckAgent:
         assert agent.agent_type == AgentType.COVERAGE_CHECK
         assert agent.model == "gpt-5-nano"
 
+    def test_logged_reason_card_matches_full_dump(self, agent):
+        """log_execution stores the same card shape as the graph nodes."""
+        card = agent.create_reason_card(
+            trigger=TriggerType.INITIAL, inputs={}, confidence=0.12345
+        )
+        state: MLOpsWorkflowState = {}
+
+        agent.log_execution(state, card)
+
+        assert state["reason_cards"] == [card.model_dump()]
+        assert state["reason_cards"][0]["confidence"] == 0.12345
+
+    def test_reason_card_timestamp_inputs_are_utc(self, agent):
+        """Naive datetimes and ISO strings are read as UTC, not local time."""
+        aware = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        card = agent.create_reason_card(trigger=TriggerType.INITIAL, inputs={})
+
+        for value in (
+            aware,
+            aware.replace(tzinfo=None),
+            "2024-05-01T12:30:15.123456",
+            "2024-05-01T12:30:15.123456Z",
+        ):
+            restored = ReasonCard.model_validate(
+                {**card.model_dump(), "timestamp": value}
+            )
+            assert restored.model_dump()["timestamp"] == aware
+
     def test_required_predecessors(self, agent):
         """Test required predecessor agents."""
         predecessors = agent.get_required_predecessor_agents()
@@ -350,6 +384,19 @@ class TestAdaptiveQuestionsAgent:
         assert "99.9%" in availability_q["choices"]
         assert availability_q["priority"] == "high"
 
+        # History, current questions and agent outputs hold separate copies
+        updates = result.state_updates
+        questions[0]["choices"].append("100%")
+        assert (
+            "100%" not in updates["questioning_history"][-1]["questions"][0]["choices"]
+        )
+        assert (
+            "100%"
+            not in updates["agent_outputs"]["adaptive.questions"]["questions"][0][
+                "choices"
+            ]
+        )
+
     async def test_questioning_termination(self, agent):
         """Test questioning termination conditions."""
         # Test with high coverage score
@@ -366,6 +413,21 @@ class TestAdaptiveQuestionsAgent:
         termination_result = await agent.should_continue_questioning(complete_state)
         assert not termination_result
 
+    def test_termination_reason_rules(self):
+        """Test the plain termination rules used by should_continue_questioning."""
+        from libs.adaptive_questions_agent import termination_reason
+
+        cases = [
+            (0, 0.4, 2, False),
+            (3, 0.4, 2, False),
+            (1, 0.8, 2, False),
+            (1, 0.72, 0, False),
+            (1, 0.72, 1, False),
+            (0, 0.4, 2, True),
+        ]
+        continues = [termination_reason(*case) is None for case in cases]
+        assert continues == [True, False, False, False, True, False]
+
 
 class TestLLMPlannerAgent:
     """Test the LLM-powered PlannerAgent."""
@@ -17,6 +17,7 @@ from contextlib import contextmanager
 from dotenv import load_dotenv
 
 from libs.job_service import JobService
+from libs.llm_agent_base import prewarm_agent_validators
 from libs.database import create_database_engine, create_session_maker
 from libs.models import Job
 from libs.graph import build_thin_graph, build_full_graph, build_streaming_test_graph
@@ -199,6 +200,7 @@ class WorkerService:
         signal.signal(signal.SIGTERM, signal_handler)
 
         logger.info(f"Worker {self.worker_id} starting...")
+        prewarm_agent_validators()
 
         try:
             await self.run_worker_loop()